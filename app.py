@@ -1,28 +1,43 @@
 from typing import Any
-from flask import Flask, render_template, request, send_from_directory, jsonify, url_for
+from flask import Flask, Blueprint, Response, current_app, render_template, request, send_from_directory, jsonify, url_for, g, has_request_context
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta, date
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 import json
+import codecs
+import gzip
+import hashlib
+import queue
+import random
 from difflib import SequenceMatcher
+from contextlib import contextmanager
 import traceback
-from waitress import serve
-from cachetools import TTLCache
+from waitress import create_server, wasyncore
+from waitress.channel import HTTPChannel
+from waitress.server import BaseWSGIServer
+from cachetools import TTLCache, LRUCache
 import threading
 import time
 import logging
 from collections import OrderedDict
 import sqlite3
 import os
+import argparse
+import atexit
+import signal
+import socket
+import uuid
 import schedule
 
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 
 # --- App Configuration ---
-app = Flask(__name__)
+# Routes and request hooks live on the dashboards blueprint; create_app() builds the Flask app.
+dashboards = Blueprint("dashboards", __name__)
 
 # --- Configuration for QC Summary App ---
 QC_CONFIG = {
@@ -35,6 +50,7 @@ QC_CONFIG["PROCESS_LOGIN_URL"] = f"{QC_CONFIG['BASE_URL']}/process-login"
 QC_CONFIG["QC_NEWS_PAGE_URL"] = f"{QC_CONFIG['BASE_URL']}/qcnews"
 QC_CONFIG["CHANNEL_DATA_API_URL"] = f"{QC_CONFIG['BASE_URL']}/qcnews/getdatagrid"
 QC_CONFIG["STORY_DATA_API_URL"] = f"{QC_CONFIG['BASE_URL']}/qcnews/getstorydatagrid"
+QC_CSRF_TTL_SECONDS = 1800  # Reuse the QC CSRF token and session for this long before re-checking
 
 # --- Configuration for Logger Tagging App ---
 LOGGER_CONFIG = {
@@ -56,8 +72,15 @@ LOGGER_CONFIG = {
 XEN_API_URL = "http://10.18.80.14:2996/command/ExportEPGTabsons"
 EQ_API_URL = "http://10.18.50.26:5000/api/tabsons/getreport/{channel_id}/{date}"
 MAX_EQ_CONCURRENT_REQUESTS = 2
+MAX_LOGGER_FETCH_WORKERS = 10  # Bound on parallel Xen chunk requests per fetch
+XEN_CHUNK_SIZE = 10  # Channel IDs per ExportEPGTabsons request
+XEN_STREAM_CHUNK_BYTES = 64 * 1024  # Read size when streaming ExportEPGTabsons responses
 EQ_REQUEST_DELAY_SECONDS = 0.25
-cache = TTLCache(maxsize=128, ttl=900)
+LOGGER_CLUSTER_CACHE_SIZE = 128  # (date, cluster) snapshots held in memory in front of SQLite
+# Shared per-channel Xen/EQ results keyed by (source, channel_id, date), read by every dashboard and cluster view
+UPSTREAM_RESULT_TTL_SECONDS = 900
+upstream_results = TTLCache(maxsize=4096, ttl=UPSTREAM_RESULT_TTL_SECONDS)
+upstream_results_lock = threading.Lock()
 
 # --- CHANNEL DEFINITIONS ---
 CLUSTERS = {
@@ -79,6 +102,23 @@ QC_COMPLETION_THRESHOLD = "23:00:00"
 FUZZY_MATCH_THRESHOLD = 0.8
 DEFAULT_PULL_START_TIME = "06:00:00"
 DEFAULT_PULL_END_TIME = "23:59:59"
+QC_DONE_TIME = "23:30:00"  # A last QC clip at or after this is QC DONE regardless of logger state
+
+# --- Incremental QC Polling ---
+# Channels already QC DONE are never re-polled; the rest are polled less often the
+# further their last clip is from QC_COMPLETION_THRESHOLD.
+QC_POLL_MINUTES_PER_HOUR_BEHIND = 10
+QC_POLL_MAX_INTERVAL_MINUTES = 60
+
+# --- Stale-While-Revalidate ---
+# The IT and Logger dashboard APIs serve cached snapshots straight away with their age.
+# Past the soft TTL a background refresh is started; only past the hard TTL does the
+# request wait for fresh data. The soft TTL matches the upstream result caches, so a
+# revalidation always reaches the upstreams. Dates before yesterday no longer change
+# and are served from the cache whatever their age.
+DASHBOARD_SOFT_TTL_SECONDS = UPSTREAM_RESULT_TTL_SECONDS
+DASHBOARD_HARD_TTL_SECONDS = 60 * 60
+MAX_BACKGROUND_REFRESH_WORKERS = 2
 
 # --- Channel Name Aliases ---
 CHANNEL_NAME_ALIASES = {
@@ -91,14 +131,364 @@ CHANNEL_NAME_ALIASES = {
 
 # --- Global Session for QC App ---
 authenticated_session = requests.Session()
+qc_auth = {"csrf_token": None, "fetched_at": 0.0}  # Cached CSRF token for authenticated_session
+qc_auth_lock = threading.Lock()
+
+class QCAuthError(requests.RequestException):
+    """Raised when the QC server can't be logged in to."""
+
+# --- Upstream HTTP Clients ---
+# One keep-alive connection pool per upstream, sized for the number of threads that hit it.
+# max_in_flight is the upstream's concurrency budget: however many dashboard requests and
+# scheduled refreshes run at once, no more requests than that are sent to it together.
+UPSTREAM_CLIENT_CONFIG = {
+    "xen": {"pool_size": MAX_LOGGER_FETCH_WORKERS, "max_in_flight": MAX_LOGGER_FETCH_WORKERS, "connect_timeout": 10, "read_timeout": 120, "retries": 2},
+    "eq": {"pool_size": MAX_EQ_CONCURRENT_REQUESTS, "max_in_flight": MAX_EQ_CONCURRENT_REQUESTS, "connect_timeout": 10, "read_timeout": 60, "retries": 2},
+    "qc": {"pool_size": 10, "max_in_flight": 10, "connect_timeout": 10, "read_timeout": 60, "retries": 2},
+}
+UPSTREAM_RETRY_BACKOFF_SECONDS = 0.5  # Base delay, doubled per attempt with full jitter
+UPSTREAM_RETRY_STATUSES = {502, 503, 504}
+
+class UpstreamClient:
+    """Keep-alive HTTP client for one upstream with a sized connection pool.
+    
+    Calls made with idempotent=True are retried with jittered exponential backoff on
+    connection errors, timeouts and UPSTREAM_RETRY_STATUSES. At most max_in_flight
+    requests run against the upstream at once, a streamed one until its response is
+    closed; callers past the budget queue. Connection reuse is tracked from the pool so
+    stats() can show whether handshakes still dominate.
+    """
+    def __init__(self, name, pool_size, max_in_flight, connect_timeout, read_timeout, retries, session=None):
+        self.name = name
+        self._budget = threading.BoundedSemaphore(max_in_flight)
+        self.session = session or requests.Session()
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self._adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self._stats_lock = threading.Lock()
+        self._retried = 0
+        self._failed = 0
+
+    def request(self, method, url, idempotent=False, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        attempts = 1 + (self.retries if idempotent else 0)
+        for attempt in range(1, attempts + 1):
+            try:
+                self._acquire_budget()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except BaseException:
+                    self._release_budget()
+                    raise
+                if kwargs.get("stream"):
+                    self._release_budget_on_close(response)
+                else:
+                    self._release_budget()
+                if attempt == attempts or response.status_code not in UPSTREAM_RETRY_STATUSES:
+                    return response
+                response.close()
+                reason = f"HTTP {response.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == attempts:
+                    with self._stats_lock: self._failed += 1
+                    raise
+                reason = str(e)
+            delay = random.uniform(0, UPSTREAM_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+            logging.warning(f"{self.name} upstream {method} {url} failed ({reason}), retry {attempt}/{attempts - 1} in {delay:.2f}s")
+            with self._stats_lock: self._retried += 1
+            time.sleep(delay)
+
+    def _acquire_budget(self):
+        self._budget.acquire()
+        upstream_in_flight.inc(upstream=self.name)
+
+    def _release_budget(self):
+        upstream_in_flight.dec(upstream=self.name)
+        self._budget.release()
+
+    def _release_budget_on_close(self, response):
+        """A streamed body is read after request() returns, so its slot is freed when the response is closed."""
+        close, released = response.close, threading.Event()
+        def close_and_release():
+            close()
+            if not released.is_set():
+                released.set()
+                self._release_budget()
+        response.close = close_and_release
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        """Requests sent, new connections opened and the share of requests that reused a connection."""
+        pools = self._adapter.poolmanager.pools
+        requests_sent = connections_opened = 0
+        for pool_key in list(pools.keys()):
+            pool = pools.get(pool_key)
+            if pool is None: continue
+            requests_sent += pool.num_requests
+            connections_opened += pool.num_connections
+        reused = max(requests_sent - connections_opened, 0)
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connection_reuse_ratio": round(reused / requests_sent, 3) if requests_sent else 0.0,
+            "retries": self._retried,
+            "failures": self._failed,
+        }
+
+xen_client = UpstreamClient("xen", **UPSTREAM_CLIENT_CONFIG["xen"])
+eq_client = UpstreamClient("eq", **UPSTREAM_CLIENT_CONFIG["eq"])
+qc_client = UpstreamClient("qc", session=authenticated_session, **UPSTREAM_CLIENT_CONFIG["qc"])
+
+def get_upstream_client_stats():
+    return {client.name: client.stats() for client in (xen_client, eq_client, qc_client)}
+
+# --- Metrics ---
+# Minimal Prometheus-style metrics, rendered in the text exposition format by /metrics.
+class Metric:
+    """A named metric with optional labels; values are kept per label-value tuple."""
+    metric_type = "untyped"
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values = {}
+        metrics_registry.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _format_labels(self, key, extra=()):
+        pairs = list(zip(self.label_names, key)) + list(extra)
+        if not pairs: return ""
+        escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+        return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+    def label_sets(self):
+        with self._lock:
+            return list(self._values)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, self._format_labels(key), value) for key, value in sorted(self._values.items())]
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(f"{name}{labels} {value}" for name, labels, value in self.samples())
+        return lines
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+class Gauge(Metric):
+    metric_type = "gauge"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name, help_text, label_names=(), buckets=(0.1, 0.5, 1, 5, 10, 60)):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound: counts[i] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, counts):
+                    samples.append((f"{self.name}_bucket", self._format_labels(key, [("le", f"{bound:g}")]), bucket_count))
+                samples.append((f"{self.name}_bucket", self._format_labels(key, [("le", "+Inf")]), count))
+                samples.append((f"{self.name}_sum", self._format_labels(key), total))
+                samples.append((f"{self.name}_count", self._format_labels(key), count))
+        return samples
+
+metrics_registry = []
+
+UPSTREAM_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+SCHEDULER_DURATION_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1800)
+upstream_call_seconds = Histogram("upstream_call_seconds", "Latency of upstream calls (xen_chunk, eq_channel, qc_grid, qc_story), retries included.", ["call"], UPSTREAM_LATENCY_BUCKETS)
+upstream_call_errors = Counter("upstream_call_errors_total", "Upstream calls that failed, by error.", ["call", "error"])
+cache_lookups = Counter("cache_lookups_total", "Cache lookups by cache and result (hit or miss).", ["cache", "result"])
+scheduler_job_seconds = Histogram("scheduler_job_seconds", "Duration of scheduled jobs.", ["job"], SCHEDULER_DURATION_BUCKETS)
+scheduler_job_last_run = Gauge("scheduler_job_last_run_timestamp_seconds", "Unix time the scheduled job last finished.", ["job"])
+upstream_in_flight = Gauge("upstream_in_flight", "Requests in flight to each upstream, bounded by its max_in_flight budget.", ["upstream"])
+http_requests_in_flight = Gauge("http_requests_in_flight", "Requests currently being handled.")
+event_streams_open = Gauge("event_streams_open", "Open Server-Sent Events streams.")
+scheduler_leader = Gauge("scheduler_leader", "1 while this process holds the scheduler lease and runs the scheduled jobs.")
+background_revalidations = Counter("background_revalidations_total", "Background refreshes started for stale dashboard snapshots.", ["dashboard"])
+
+class UpstreamCall:
+    """Context manager timing one upstream call; exceptions are counted as errors and re-raised."""
+    def __init__(self, call):
+        self.call = call
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        upstream_call_seconds.observe(time.perf_counter() - self.started, call=self.call)
+        if isinstance(exc_value, requests.HTTPError) and exc_value.response is not None:
+            self.error(f"HTTP {exc_value.response.status_code}")
+        elif exc_type is not None:
+            self.error(exc_type.__name__)
+        return False
+
+    def error(self, error):
+        """Count a failure that didn't raise, such as an HTTP error status."""
+        upstream_call_errors.inc(call=self.call, error=error)
+
+def record_cache_lookups(cache_name, hits, misses):
+    if hits: cache_lookups.inc(hits, cache=cache_name, result="hit")
+    if misses: cache_lookups.inc(misses, cache=cache_name, result="miss")
+
+def run_timed_job(job_name, job):
+    """Run a scheduled job and record its duration."""
+    started = time.perf_counter()
+    try:
+        return job()
+    finally:
+        scheduler_job_seconds.observe(time.perf_counter() - started, job=job_name)
+        scheduler_job_last_run.set(time.time(), job=job_name)
+
+def render_metrics():
+    lines = []
+    for metric in metrics_registry:
+        lines.extend(metric.render())
+    # Hit ratios are derived from cache_lookups_total so they can be read without a query language
+    cache_names = sorted({key[0] for key in cache_lookups.label_sets()})
+    lines += ["# HELP cache_hit_ratio Share of lookups that were hits, per cache.", "# TYPE cache_hit_ratio gauge"]
+    for cache_name in cache_names:
+        hits, misses = cache_lookups.value(cache=cache_name, result="hit"), cache_lookups.value(cache=cache_name, result="miss")
+        lines.append(f'cache_hit_ratio{{cache="{cache_name}"}} {round(hits / (hits + misses), 4) if hits + misses else 0}')
+    return "\n".join(lines) + "\n"
+
+# --- Request Phase Timing ---
+# Dashboard API responses carry a Server-Timing header with the time spent in each phase
+# (upstream calls, matching, SQLite), and requests slower than the threshold are logged
+# with the same breakdown. Phases run in parallel worker threads overlap, so they can add
+# up to more than the total.
+SLOW_REQUEST_THRESHOLD_SECONDS = 5.0
+SERVER_TIMING_ENDPOINTS = {f"dashboards.{name}" for name in ("dashboard_data_api", "logger_dashboard_data_api", "all_clusters_progress_api", "qc_channel_data_api", "qc_last_clip_times")}
+_phase_local = threading.local()  # Timings of the request a worker thread is running for
+
+class PhaseTimings:
+    """Accumulated duration and call count per phase for one request."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases = {}  # name -> [seconds, calls]
+
+    def add(self, name, seconds):
+        with self._lock:
+            phase = self.phases.setdefault(name, [0.0, 0])
+            phase[0] += seconds
+            phase[1] += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {name: {"ms": round(seconds * 1000, 1), "calls": calls} for name, (seconds, calls) in self.phases.items()}
+
+def current_phase_timings():
+    if has_request_context():
+        return g.get("phase_timings")
+    return getattr(_phase_local, "timings", None)
+
+@contextmanager
+def record_phase(name):
+    """Time a phase of the current request; a no-op outside requests (e.g. the scheduler)."""
+    timings = current_phase_timings()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+def run_with_phase_timings(timings, fn, *args):
+    """Run fn in a worker thread, recording its phases against the submitting request."""
+    _phase_local.timings = timings
+    try:
+        return fn(*args)
+    finally:
+        _phase_local.timings = None
+
+def server_timing_header(timings, total_seconds):
+    entries = [f"{name};dur={phase['ms']}" for name, phase in timings.as_dict().items()]
+    entries.append(f"total;dur={round(total_seconds * 1000, 1)}")
+    return ", ".join(entries)
+
+# --- Conditional JSON Responses ---
+# Dashboard API payloads carry a weak ETag hashed from everything but their volatile
+# fields, so a poll for an unchanged snapshot gets an empty 304 Not Modified. JSON
+# bodies are gzip-compressed for clients that accept it.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+ETAG_VOLATILE_KEYS = {"cache_age_seconds", "revalidating"}
+
+def payload_etag(payload):
+    if isinstance(payload, dict):
+        payload = {key: value for key, value in payload.items() if key not in ETAG_VOLATILE_KEYS}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+def conditional_json(payload):
+    """JSON response tagged with the payload's ETag, or a 304 if the client sent that ETag.
+    
+    POST endpoints are answered the same way, since the dashboards poll them with If-None-Match.
+    """
+    etag = payload_etag(payload)
+    response = current_app.response_class(status=304) if request.if_none_match.contains_weak(etag) else jsonify(payload)
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"  # Browsers revalidate GET polls with If-None-Match
+    return response
 
 # --- SQLite Database Configuration ---
 DB_PATH = "it_dashboard_cache.db"
 CACHE_REFRESH_MINUTES = 20  # Auto-refresh cache every 20 minutes
+DB_BUSY_TIMEOUT_SECONDS = 30  # How long a writer waits on a locked database before failing
+_db_local = threading.local()  # Per-thread database connection
 
 def init_database():
     """Initialize the SQLite database for caching IT dashboard and logger dashboard data"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db_connection()
     cursor = conn.cursor()
     
     # Create table for logger data
@@ -140,31 +530,99 @@ def init_database():
         )
     ''')
     
-    # Create table for logger dashboard cluster data
+    # Create table for the Logger dashboard's per-channel logs, stored once per channel
+    # and logger type; cluster views join it through channel_clusters
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS logger_cluster_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+        CREATE TABLE IF NOT EXISTS logger_channel_data (
             date TEXT NOT NULL,
-            cluster_name TEXT NOT NULL,
             channel_id TEXT NOT NULL,
-            channel_name TEXT NOT NULL,
             logger_type TEXT NOT NULL,
+            channel_name TEXT NOT NULL,
             start_time TEXT NOT NULL,
             end_time TEXT NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, cluster_name, channel_id, logger_type)
+            PRIMARY KEY (date, channel_id, logger_type)
         )
     ''')
     
-    # Create table for logger dashboard low duration channels
+    # Create table mapping each Logger dashboard cluster to its channels
     cursor.execute('''
-        CREATE TABLE IF NOT EXISTS logger_low_duration_channels (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
+        CREATE TABLE IF NOT EXISTS channel_clusters (
             cluster_name TEXT NOT NULL,
             channel_id TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(date, cluster_name, channel_id)
+            PRIMARY KEY (cluster_name, channel_id)
+        )
+    ''')
+    
+    # Create table recording every cache write per (dataset, date, cluster), so existence
+    # and freshness checks are one primary-key lookup instead of a scan of the cached rows
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cache_meta (
+            dataset TEXT NOT NULL,
+            date TEXT NOT NULL,
+            cluster TEXT NOT NULL DEFAULT '',
+            refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            row_count INTEGER NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dataset, date, cluster)
+        )
+    ''')
+    
+    # Carry over databases from before cache_meta, whose cache times lived only in the cached
+    # rows: the IT dashboard's per date, and the logger clusters' per date and cluster
+    cursor.execute('''
+        INSERT OR IGNORE INTO cache_meta (dataset, date, cluster, refreshed_at, row_count, version)
+        SELECT 'it', date, '', MAX(created_at), COUNT(*), 1
+        FROM dashboard_data GROUP BY date
+    ''')
+    
+    # Carry over databases from before logger_channel_data, which kept a copy of every
+    # channel's logs per cluster; the newest copy of each channel wins
+    if cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'logger_cluster_data'").fetchone():
+        cursor.execute('''
+            INSERT OR IGNORE INTO cache_meta (dataset, date, cluster, refreshed_at, row_count, version)
+            SELECT 'logger', date, cluster_name, MAX(created_at), COUNT(DISTINCT channel_id), 1
+            FROM logger_cluster_data GROUP BY date, cluster_name
+        ''')
+        cursor.execute('''
+            INSERT OR REPLACE INTO logger_channel_data (date, channel_id, logger_type, channel_name, start_time, end_time, created_at)
+            SELECT date, channel_id, logger_type, channel_name, start_time, end_time, created_at
+            FROM logger_cluster_data ORDER BY created_at, id
+        ''')
+        cursor.execute("DROP TABLE logger_cluster_data")
+        cursor.execute("DROP TABLE IF EXISTS logger_low_duration_channels")
+    
+    # The cluster membership comes from CLUSTERS; replace the mapping with the current one
+    cursor.execute("DELETE FROM channel_clusters")
+    cursor.executemany("INSERT OR IGNORE INTO channel_clusters (cluster_name, channel_id) VALUES (?, ?)",
+                       [(cluster_name, channel_id) for cluster_name, channel_ids in CLUSTERS.items() for channel_id in channel_ids])
+    
+    # Create table for per-channel QC last-clip polling state
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS qc_poll_state (
+            date TEXT NOT NULL,
+            normalized_name TEXT NOT NULL,
+            last_qc_end_time TEXT,
+            polled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            next_poll_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (date, normalized_name)
+        )
+    ''')
+    
+    # Create tables for the persistent logger -> QC fuzzy match index
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS channel_match_index (
+            logger_name TEXT PRIMARY KEY,
+            qc_name TEXT,
+            score REAL NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS channel_match_qc_names (
+            qc_name TEXT PRIMARY KEY,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
     
@@ -182,147 +640,253 @@ def init_database():
         )
     ''')
     
+    # Create table for the IT and Logger dashboard change log behind the since=<version> delta APIs
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dashboard_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dataset TEXT NOT NULL,
+            date TEXT NOT NULL,
+            scope TEXT NOT NULL DEFAULT '',
+            row_key TEXT NOT NULL,
+            row_json TEXT,
+            changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_dashboard_changes_scope
+        ON dashboard_changes (dataset, date, scope, id)
+    ''')
+    
+    # Create table for the decayed request counts that prioritize scheduled refreshes
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS refresh_demand (
+            dataset TEXT NOT NULL,
+            date TEXT NOT NULL,
+            scope TEXT NOT NULL DEFAULT '',
+            demand REAL NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (dataset, date, scope)
+        )
+    ''')
+    
+    # Create table for the leases that elect one process to run the scheduler and each background refresh
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS leases (
+            name TEXT PRIMARY KEY,
+            holder TEXT NOT NULL,
+            acquired_at TIMESTAMP NOT NULL,
+            renewed_at TIMESTAMP NOT NULL,
+            expires_at TIMESTAMP NOT NULL
+        )
+    ''')
+    
     conn.commit()
-    conn.close()
     logging.info("Database initialized successfully")
 
 def get_db_connection():
-    """Get a database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get this thread's database connection, opening it on first use.
+    
+    Connections are reused for the life of the thread (waitress workers, scheduler,
+    executor threads) and run in WAL mode, so readers never block behind a writer.
+    """
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None or _db_local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT_SECONDS)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _db_local.conn, _db_local.path = conn, DB_PATH
     return conn
 
+# --- Cache Metadata ---
+# Every write to a date's cached dashboard data (dataset "it"), logger cluster data
+# ("logger", per cluster), cluster progress ("logger_progress") and raw IT logger and
+# QC data ("logger_data", "qc_data") upserts its cache_meta row in the same transaction:
+# when it was refreshed, how many rows it holds and a version bumped on every write.
+
+def update_cache_meta(conn, dataset, date, cluster, row_count):
+    """Record a cache write in cache_meta, in the caller's transaction; returns the new version"""
+    conn.execute('''
+        INSERT INTO cache_meta (dataset, date, cluster, row_count, version) VALUES (?, ?, ?, ?, 1)
+        ON CONFLICT(dataset, date, cluster) DO UPDATE SET
+            refreshed_at = CURRENT_TIMESTAMP,
+            row_count = excluded.row_count,
+            version = version + 1
+    ''', (dataset, date, cluster, row_count))
+    return conn.execute("SELECT version FROM cache_meta WHERE dataset = ? AND date = ? AND cluster = ?",
+                        (dataset, date, cluster)).fetchone()['version']
+
+@record_phase("sqlite_read")
+def get_cache_meta(dataset, date, cluster=""):
+    """{'age': seconds, 'row_count', 'version'} of a cached dataset, or None if it was never written"""
+    conn = get_db_connection()
+    row = conn.execute('''
+        SELECT (julianday('now') - julianday(refreshed_at)) * 86400 AS age, row_count, version
+        FROM cache_meta WHERE dataset = ? AND date = ? AND cluster = ?
+    ''', (dataset, date, cluster)).fetchone()
+    return dict(row) if row else None
+
+def get_cache_age(dataset, date, cluster=""):
+    """Seconds since a dataset with rows was last refreshed, or None if it isn't cached"""
+    meta = get_cache_meta(dataset, date, cluster)
+    return meta['age'] if meta and meta['row_count'] else None
+
 def is_data_cached(date):
     """Check if data is cached for a specific date"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Check if we have dashboard data for this date
-    cursor.execute("SELECT COUNT(*) as count FROM dashboard_data WHERE date = ?", (date,))
-    count = cursor.fetchone()['count']
-    
-    conn.close()
-    return count > 0
+    return get_cache_age("it", date) is not None
 
 def is_cache_fresh(date):
     """Check if cached data is fresh (within CACHE_REFRESH_MINUTES)"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Get the creation time of the most recent record for this date
-    cursor.execute("""
-        SELECT created_at FROM dashboard_data
-        WHERE date = ?
-        ORDER BY created_at DESC
-        LIMIT 1
-    """, (date,))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        return False
-    
-    # Parse the timestamp and check if it's within the refresh window
-    created_at = datetime.strptime(result['created_at'], '%Y-%m-%d %H:%M:%S')
-    time_diff = datetime.now() - created_at
-    
-    return time_diff.total_seconds() < (CACHE_REFRESH_MINUTES * 60)
+    meta = get_cache_meta("it", date)
+    return bool(meta) and meta['age'] < CACHE_REFRESH_MINUTES * 60
+
+def get_dashboard_cache_age(date):
+    """Seconds since the IT dashboard for a date was last refreshed, or None if it isn't cached"""
+    return get_cache_age("it", date)
 
 def should_refresh_cache(date):
-    """Determine if cache should be refreshed for a given date"""
-    if not is_data_cached(date):
-        return False  # No data exists, need to fetch fresh
-    
-    return not is_cache_fresh(date)  # Data exists but is stale
+    """Determine if cache should be refreshed for a given date (cached but stale)"""
+    age = get_cache_age("it", date)
+    return age is not None and age >= CACHE_REFRESH_MINUTES * 60
 
+@record_phase("sqlite_write")
 def cache_logger_data(date, logger_data):
     """Cache logger data for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing data for this date
-    cursor.execute("DELETE FROM logger_data WHERE date = ?", (date,))
-    
-    # Insert new data
-    for norm_name, data in logger_data.items():
-        cursor.execute('''
+    with conn:
+        # Clear existing data for this date
+        conn.execute("DELETE FROM logger_data WHERE date = ?", (date,))
+        conn.executemany('''
             INSERT INTO logger_data (date, normalized_name, original_name, logger_end_time)
             VALUES (?, ?, ?, ?)
-        ''', (date, norm_name, data['original_name'], data['logger_end_time']))
-    
-    conn.commit()
-    conn.close()
+        ''', [(date, norm_name, data['original_name'], data['logger_end_time']) for norm_name, data in logger_data.items()])
+        update_cache_meta(conn, "logger_data", date, "", len(logger_data))
     logging.info(f"Cached logger data for {date}")
 
+@record_phase("sqlite_write")
 def cache_qc_data(date, qc_data):
     """Cache QC data for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing data for this date
-    cursor.execute("DELETE FROM qc_data WHERE date = ?", (date,))
-    
-    # Insert new data
-    for norm_name, data in qc_data.items():
-        cursor.execute('''
+    with conn:
+        # Clear existing data for this date
+        conn.execute("DELETE FROM qc_data WHERE date = ?", (date,))
+        conn.executemany('''
             INSERT INTO qc_data (date, normalized_name, last_qc_end_time)
             VALUES (?, ?, ?)
-        ''', (date, norm_name, data['last_qc_end_time']))
-    
-    conn.commit()
-    conn.close()
+        ''', [(date, norm_name, data['last_qc_end_time']) for norm_name, data in qc_data.items()])
+        update_cache_meta(conn, "qc_data", date, "", len(qc_data))
     logging.info(f"Cached QC data for {date}")
 
-def cache_dashboard_data(date, dashboard_data):
-    """Cache processed dashboard data for a specific date"""
+# --- Dashboard Change Log ---
+# Every row the IT and Logger dashboard caches add, change or remove is appended to
+# dashboard_changes, scoped by dataset ("it" or "logger"), date and cluster. The id of
+# the newest entry in a scope is its version token; a client passing since=<version>
+# gets only the rows changed after it. A removed row is logged with row_json NULL.
+
+def log_dashboard_changes(conn, dataset, date, scope, upserted_rows, removed_keys):
+    """Append upserted rows ({row_key: row}) and removed row keys to the change log, in the caller's transaction"""
+    conn.executemany('''
+        INSERT INTO dashboard_changes (dataset, date, scope, row_key, row_json)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [(dataset, date, scope, key, json.dumps(row)) for key, row in upserted_rows.items()]
+         + [(dataset, date, scope, key, None) for key in removed_keys])
+
+@record_phase("sqlite_read")
+def get_change_version(dataset, date, scope=""):
+    """Current version token of a dashboard scope (0 if nothing was logged yet)"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing data for this date
-    cursor.execute("DELETE FROM dashboard_data WHERE date = ?", (date,))
-    
-    # Insert new data
-    for item in dashboard_data:
-        cursor.execute('''
+    row = conn.execute('''
+        SELECT MAX(id) AS version FROM dashboard_changes
+        WHERE dataset = ? AND date = ? AND scope = ?
+    ''', (dataset, date, scope)).fetchone()
+    return row['version'] or 0
+
+@record_phase("sqlite_read")
+def get_dashboard_changes(dataset, date, scope, since):
+    """Rows changed in a dashboard scope after a version token, as (upserted_rows, removed_keys, version).
+    
+    Only the latest change per row is returned. Version tokens are change log ids shared by
+    every scope; a token that is not an id in this scope's own log (one from another date or
+    cluster, from a date since cleaned up, or 0 from before anything was logged) returns None
+    and the caller sends a full response.
+    """
+    conn = get_db_connection()
+    if not conn.execute('''
+        SELECT 1 FROM dashboard_changes WHERE id = ? AND dataset = ? AND date = ? AND scope = ?
+    ''', (since, dataset, date, scope)).fetchone():
+        return None
+    
+    rows = conn.execute('''
+        SELECT id, row_key, row_json FROM dashboard_changes
+        WHERE dataset = ? AND date = ? AND scope = ? AND id > ?
+        ORDER BY id
+    ''', (dataset, date, scope, since)).fetchall()
+    latest = {row['row_key']: row['row_json'] for row in rows}
+    upserted_rows = [json.loads(row_json) for row_json in latest.values() if row_json is not None]
+    removed_keys = [key for key, row_json in latest.items() if row_json is None]
+    return upserted_rows, removed_keys, rows[-1]['id'] if rows else since
+
+def parse_version_token(value):
+    """The since=<version> parameter of a dashboard API request, or None for a full response"""
+    try:
+        since = int(value)
+    except (TypeError, ValueError):
+        return None
+    return since if since >= 0 else None
+
+@record_phase("sqlite_write")
+def cache_dashboard_data(date, changed_rows, removed_channel_names=()):
+    """Cache changed dashboard rows for a specific date and return the new dashboard version.
+    
+    Only the given rows are written; channels in removed_channel_names are deleted.
+    The date's refresh time and version are bumped even when nothing changed.
+    """
+    conn = get_db_connection()
+    with conn:
+        conn.executemany('''
             INSERT INTO dashboard_data (date, channel_name, logger_end_time, qc_end_time, status_class)
             VALUES (?, ?, ?, ?, ?)
-        ''', (date, item['channel_name'], item['logger_end_time'], item['qc_end_time'], item['status_class']))
-    
-    conn.commit()
-    conn.close()
-    logging.info(f"Cached dashboard data for {date}")
-
+            ON CONFLICT(date, channel_name) DO UPDATE SET
+                logger_end_time = excluded.logger_end_time,
+                qc_end_time = excluded.qc_end_time,
+                status_class = excluded.status_class,
+                created_at = CURRENT_TIMESTAMP
+        ''', [(date, item['channel_name'], item['logger_end_time'], item['qc_end_time'], item['status_class']) for item in changed_rows])
+        conn.executemany("DELETE FROM dashboard_data WHERE date = ? AND channel_name = ?",
+                         [(date, channel_name) for channel_name in removed_channel_names])
+        log_dashboard_changes(conn, "it", date, "", {item['channel_name']: item for item in changed_rows}, removed_channel_names)
+        row_count = conn.execute("SELECT COUNT(*) AS row_count FROM dashboard_data WHERE date = ?", (date,)).fetchone()['row_count']
+        version = update_cache_meta(conn, "it", date, "", row_count)
+    logging.info(f"Cached dashboard data for {date}: {len(changed_rows)} changed, {len(removed_channel_names)} removed")
+    return version
+
+def get_dashboard_version(date):
+    """Get the version of the cached dashboard data for a date (0 if never cached)"""
+    meta = get_cache_meta("it", date)
+    return meta['version'] if meta else 0
+
+@record_phase("sqlite_read")
 def get_cached_dashboard_data(date):
-    """Retrieve cached dashboard data for a specific date"""
+    """Retrieve cached dashboard data for a specific date, in dashboard order"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    rows = conn.execute('''
         SELECT channel_name, logger_end_time, qc_end_time, status_class
         FROM dashboard_data
         WHERE date = ?
-        ORDER BY channel_name
-    ''', (date,))
-    
-    rows = cursor.fetchall()
-    conn.close()
-    
-    return [dict(row) for row in rows]
+    ''', (date,)).fetchall()
+    return sort_dashboard_rows(dict(row) for row in rows)
 
 def get_cached_logger_data(date):
     """Retrieve cached logger data for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    rows = conn.execute('''
         SELECT normalized_name, original_name, logger_end_time
         FROM logger_data
         WHERE date = ?
-    ''', (date,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    ''', (date,)).fetchall()
     
     return {row['normalized_name']: {
         'original_name': row['original_name'],
@@ -332,92 +896,96 @@ def get_cached_logger_data(date):
 def get_cached_qc_data(date):
     """Retrieve cached QC data for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    rows = conn.execute('''
         SELECT normalized_name, last_qc_end_time
         FROM qc_data
         WHERE date = ?
-    ''', (date,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    ''', (date,)).fetchall()
     
     return {row['normalized_name']: {
         'last_qc_end_time': row['last_qc_end_time']
     } for row in rows}
 
+@record_phase("sqlite_write")
 def cache_logger_cluster_data(date, cluster_name, cluster_data, low_durn_channels):
-    """Cache logger dashboard cluster data for a specific date"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing data for this date and cluster
-    cursor.execute("DELETE FROM logger_cluster_data WHERE date = ? AND cluster_name = ?", (date, cluster_name))
-    cursor.execute("DELETE FROM logger_low_duration_channels WHERE date = ? AND cluster_name = ?", (date, cluster_name))
-    
-    # Insert cluster data
-    for channel_id, data in cluster_data.items():
-        for log in data['logs']:
-            cursor.execute('''
-                INSERT INTO logger_cluster_data (date, cluster_name, channel_id, channel_name, logger_type, start_time, end_time)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (date, cluster_name, channel_id, data['name'], log['logger'], log['start'], log['end']))
-    
-    # Insert low duration channels
-    for channel_id in low_durn_channels:
-        cursor.execute('''
-            INSERT INTO logger_low_duration_channels (date, cluster_name, channel_id)
-            VALUES (?, ?, ?)
-        ''', (date, cluster_name, channel_id))
+    """Cache logger dashboard cluster data for a specific date.
     
-    conn.commit()
-    conn.close()
-    logging.info(f"Cached logger cluster data for {cluster_name} on {date}")
+    Logs are stored once per channel and only channels that changed are rewritten; a
+    channel of the cluster missing from cluster_data has no logs and is removed. Every
+    cluster sharing a changed channel logs the change and gets an update event, and every
+    cluster whose channels were all written here counts as refreshed in cache_meta.
+    """
+    conn = get_db_connection()
+    members = set(CLUSTERS[cluster_name])
+    rows = logger_channel_rows(cluster_data, low_durn_channels)
+    with conn:
+        # Take the write lock before reading the previous rows, so concurrent writers log consistent changes
+        conn.execute("BEGIN IMMEDIATE")
+        previous_rows = logger_channel_rows(*get_cached_logger_cluster_data(date, cluster_name))
+        changed_ids = {cid for cid, row in rows.items() if previous_rows.get(cid) != row}
+        changed_ids.update(cid for cid in previous_rows if cid not in rows)
+        
+        conn.executemany("DELETE FROM logger_channel_data WHERE date = ? AND channel_id = ?",
+                         [(date, channel_id) for channel_id in changed_ids])
+        conn.executemany('''
+            INSERT INTO logger_channel_data (date, channel_id, logger_type, channel_name, start_time, end_time)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(date, channel_id, log['logger'], cluster_data[channel_id]['name'], log['start'], log['end'])
+              for channel_id in changed_ids if channel_id in cluster_data for log in cluster_data[channel_id]['logs']])
+        
+        covered_clusters, touched_clusters = [], []
+        for other_name, other_ids in CLUSTERS.items():
+            other_ids = set(other_ids)
+            if other_ids <= members:
+                covered_clusters.append(other_name)
+                update_cache_meta(conn, "logger", date, other_name, len(other_ids & rows.keys()))
+            touched_ids = other_ids & changed_ids
+            if touched_ids or other_name == cluster_name:
+                touched_clusters.append(other_name)
+                log_dashboard_changes(conn, "logger", date, other_name,
+                                      {cid: rows[cid] for cid in touched_ids if cid in rows},
+                                      [cid for cid in touched_ids if cid not in rows])
+    logging.info(f"Cached logger cluster data for {cluster_name} on {date}: {len(changed_ids)} of {len(members)} channels changed")
+    
+    for other_name in touched_clusters:
+        if other_name != cluster_name:
+            logger_cluster_cache.invalidate((date, other_name))  # Its memory copy predates the changed channels
+        if other_name in covered_clusters:
+            other_ids = set(CLUSTERS[other_name])
+            other_data = {cid: data for cid, data in cluster_data.items() if cid in other_ids}
+            other_low_durn = low_durn_channels & other_ids
+        else:
+            other_data, other_low_durn = get_cached_logger_cluster_data(date, other_name)
+        event_broker.publish("logger_cluster", ("logger_cluster", date, other_name),
+                             {"date": date, "cluster": other_name, **logger_cluster_payload(other_data, other_low_durn)})
 
+@record_phase("sqlite_write")
 def cache_logger_cluster_progress(date, cluster_progress):
     """Cache logger dashboard cluster progress for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Clear existing data for this date
-    cursor.execute("DELETE FROM logger_cluster_progress WHERE date = ?", (date,))
-    
-    # Insert progress data
-    for cluster_name, progress in cluster_progress.items():
-        cursor.execute('''
+    with conn:
+        # Clear existing data for this date
+        conn.execute("DELETE FROM logger_cluster_progress WHERE date = ?", (date,))
+        conn.executemany('''
             INSERT INTO logger_cluster_progress (date, cluster_name, total_channels, qced_channels, percentage)
             VALUES (?, ?, ?, ?, ?)
-        ''', (date, cluster_name, progress['total'], progress['qced'], progress['percentage']))
-    
-    conn.commit()
-    conn.close()
+        ''', [(date, cluster_name, progress['total'], progress['qced'], progress['percentage'])
+              for cluster_name, progress in cluster_progress.items()])
+        update_cache_meta(conn, "logger_progress", date, "", len(cluster_progress))
     logging.info(f"Cached logger cluster progress for {date}")
+    event_broker.publish("logger_progress", ("logger_progress", date), {"date": date, "progress": cluster_progress})
 
+@record_phase("sqlite_read")
 def get_cached_logger_cluster_data(date, cluster_name):
     """Retrieve cached logger dashboard cluster data for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # Get cluster data
-    cursor.execute('''
-        SELECT channel_id, channel_name, logger_type, start_time, end_time
-        FROM logger_cluster_data
-        WHERE date = ? AND cluster_name = ?
-        ORDER BY channel_id, logger_type
-    ''', (date, cluster_name))
-    
-    rows = cursor.fetchall()
-    
-    # Get low duration channels
-    cursor.execute('''
-        SELECT channel_id
-        FROM logger_low_duration_channels
-        WHERE date = ? AND cluster_name = ?
-    ''', (date, cluster_name))
-    
-    low_durn_rows = cursor.fetchall()
-    conn.close()
+    rows = conn.execute('''
+        SELECT d.channel_id, d.channel_name, d.logger_type, d.start_time, d.end_time
+        FROM channel_clusters c
+        JOIN logger_channel_data d ON d.date = ? AND d.channel_id = c.channel_id
+        WHERE c.cluster_name = ?
+        ORDER BY d.channel_id, d.logger_type
+    ''', (date, cluster_name)).fetchall()
     
     # Reconstruct the data structure
     cluster_data = defaultdict(lambda: {"name": "", "logs": []})
@@ -430,74 +998,54 @@ def get_cached_logger_cluster_data(date, cluster_name):
             "end": row['end_time']
         })
     
-    low_durn_channels = {row['channel_id'] for row in low_durn_rows}
-    
-    return dict(cluster_data), low_durn_channels
+    cluster_data = dict(cluster_data)
+    return cluster_data, find_low_duration_channels(cluster_data)
 
+@record_phase("sqlite_read")
 def get_cached_logger_cluster_progress(date):
     """Retrieve cached logger dashboard cluster progress for a specific date"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    rows = conn.execute('''
         SELECT cluster_name, total_channels, qced_channels, percentage
         FROM logger_cluster_progress
         WHERE date = ?
-    ''', (date,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    ''', (date,)).fetchall()
     
     return {row['cluster_name']: {
         'total': row['total_channels'],
         'qced': row['qced_channels'],
-        'percentage': row['percentage']
+        'percentage': row['percentage'],
+        'error': None
     } for row in rows}
 
-def is_logger_data_cached(date, cluster_name):
-    """Check if logger dashboard data is cached for a specific date and cluster"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT COUNT(*) as count FROM logger_cluster_data
-        WHERE date = ? AND cluster_name = ?
-    ''', (date, cluster_name))
-    
-    count = cursor.fetchone()['count']
-    conn.close()
-    
-    return count > 0
+def get_logger_cache_age(date, cluster_name):
+    """Seconds since a cluster's logger data for a date was cached, or None if it isn't cached"""
+    return get_cache_age("logger", date, cluster_name)
 
-def is_logger_cache_fresh(date, cluster_name):
-    """Check if cached logger dashboard data is fresh (within CACHE_REFRESH_MINUTES)"""
+@record_phase("sqlite_read")
+def get_qc_poll_state(date):
+    """Retrieve per-channel QC polling state for a date as {normalized_name: (last_qc_end_time, is_due)}"""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT created_at FROM logger_cluster_data
-        WHERE date = ? AND cluster_name = ?
-        ORDER BY created_at DESC
-        LIMIT 1
-    ''', (date, cluster_name))
-    
-    result = cursor.fetchone()
-    conn.close()
-    
-    if not result:
-        return False
-    
-    created_at = datetime.strptime(result['created_at'], '%Y-%m-%d %H:%M:%S')
-    time_diff = datetime.now() - created_at
-    
-    return time_diff.total_seconds() < (CACHE_REFRESH_MINUTES * 60)
+    rows = conn.execute('''
+        SELECT normalized_name, last_qc_end_time, next_poll_at <= datetime('now') AS due
+        FROM qc_poll_state
+        WHERE date = ?
+    ''', (date,)).fetchall()
+    return {row['normalized_name']: (row['last_qc_end_time'], bool(row['due'])) for row in rows}
 
-def should_refresh_logger_cache(date, cluster_name):
-    """Determine if logger dashboard cache should be refreshed for a given date and cluster"""
-    if not is_logger_data_cached(date, cluster_name):
-        return False  # No data exists, need to fetch fresh
-    
-    return not is_logger_cache_fresh(date, cluster_name)  # Data exists but is stale
+@record_phase("sqlite_write")
+def save_qc_poll_state(date, polled_channels):
+    """Store polled QC channels, given as {normalized_name: (last_qc_end_time, next_poll_minutes)}"""
+    conn = get_db_connection()
+    with conn:
+        conn.executemany('''
+            INSERT INTO qc_poll_state (date, normalized_name, last_qc_end_time, next_poll_at)
+            VALUES (?, ?, ?, datetime('now', ?))
+            ON CONFLICT(date, normalized_name) DO UPDATE SET
+                last_qc_end_time = excluded.last_qc_end_time,
+                polled_at = CURRENT_TIMESTAMP,
+                next_poll_at = excluded.next_poll_at
+        ''', [(date, name, last_time, f"+{minutes} minutes") for name, (last_time, minutes) in polled_channels.items()])
 
 def cleanup_old_data():
     """Clean up data older than the current week (Sunday to Sunday)"""
@@ -514,199 +1062,315 @@ def cleanup_old_data():
     previous_sunday = last_sunday - timedelta(days=7)
     
     conn = get_db_connection()
-    cursor = conn.cursor()
+    changes_before = conn.total_changes
     
     # Delete data older than the previous Sunday
-    cursor.execute("DELETE FROM logger_data WHERE date < ?", (previous_sunday.isoformat(),))
-    cursor.execute("DELETE FROM qc_data WHERE date < ?", (previous_sunday.isoformat(),))
-    cursor.execute("DELETE FROM dashboard_data WHERE date < ?", (previous_sunday.isoformat(),))
-    cursor.execute("DELETE FROM logger_cluster_data WHERE date < ?", (previous_sunday.isoformat(),))
-    cursor.execute("DELETE FROM logger_low_duration_channels WHERE date < ?", (previous_sunday.isoformat(),))
-    cursor.execute("DELETE FROM logger_cluster_progress WHERE date < ?", (previous_sunday.isoformat(),))
-    
-    deleted_rows = conn.total_changes
-    conn.commit()
-    conn.close()
+    with conn:
+        for table in ("logger_data", "qc_data", "qc_poll_state", "dashboard_data", "cache_meta", "dashboard_changes",
+                      "refresh_demand", "logger_channel_data", "logger_cluster_progress"):
+            conn.execute(f"DELETE FROM {table} WHERE date < ?", (previous_sunday.isoformat(),))
+    
+    deleted_rows = conn.total_changes - changes_before
+    for cached_date in {key[0] for key in logger_cluster_cache.keys() if key[0] < previous_sunday.isoformat()}:
+        logger_cluster_cache.invalidate((cached_date,))
     
     logging.info(f"Cleaned up {deleted_rows} old records from database")
 
-def auto_refresh_cache():
-    """Automatically refresh cache for today's date"""
-    today = date.today().isoformat()
-    
-    logging.info(f"Auto-refreshing cache for {today}")
+# --- Demand-Driven Refresh Scheduler ---
+# Dashboard API requests and open update streams count as demand for their
+# (dataset, date, cluster) view. Each process buffers its counts and adds them to
+# refresh_demand on every lease heartbeat, where they decay with DEMAND_HALF_LIFE_MINUTES.
+# Each tick the scheduler leader refreshes the stale views of today and yesterday that
+# were wanted recently, ordered by staleness times demand, on a bounded worker pool.
+# Requests for any other date, or for a cluster not in CLUSTERS, are not counted.
+REFRESH_TICK_MINUTES = 5
+MAX_REFRESHES_PER_TICK = 12
+MAX_SCHEDULED_REFRESH_WORKERS = 3
+DEMAND_HALF_LIFE_MINUTES = 60
+MIN_REFRESH_DEMAND = 0.5  # Views wanted less than this (about one request in the last hour) are left alone
+PROGRESS_DEMAND_WEIGHT = 0.2  # The progress API reads every cluster, so it counts a little for each
+OPEN_STREAM_DEMAND_WEIGHT = 0.25  # Per heartbeat: an open update stream counts like a page polling every 2 minutes
+refresh_executor = ThreadPoolExecutor(max_workers=MAX_SCHEDULED_REFRESH_WORKERS, thread_name_prefix="refresh")
+_pending_demand = defaultdict(float)  # (dataset, date, scope) -> requests not yet flushed to SQLite
+_pending_demand_lock = threading.Lock()
+
+def demand_dates():
+    """The dates whose views the scheduler refreshes: today and yesterday"""
+    today = date.today()
+    return today.isoformat(), (today - timedelta(days=1)).isoformat()
+
+def record_demand(dataset, selected_date, scope="", weight=1.0):
+    """Count a request for a dashboard view ("it", or "logger" with the cluster as scope)"""
+    if selected_date not in demand_dates() or (dataset == "logger" and scope not in CLUSTERS): return
+    with _pending_demand_lock:
+        _pending_demand[(dataset, selected_date, scope)] += weight
+
+def flush_refresh_demand():
+    """Add this process's buffered demand, plus its open update streams, to refresh_demand"""
+    for dataset, selected_date, scope, weight in event_broker.subscribed_views():
+        record_demand(dataset, selected_date, scope, weight * OPEN_STREAM_DEMAND_WEIGHT)
+    with _pending_demand_lock:
+        pending = dict(_pending_demand)
+        _pending_demand.clear()
+    if not pending: return
     
-    try:
-        # Refresh IT Dashboard data
-        if is_data_cached(today) or should_refresh_cache(today):
-            logging.info(f"Auto-refreshing IT dashboard data for {today}")
-            
-            # Fetch fresh data
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                future_logger_data = executor.submit(get_all_logger_data, today)
-                future_qc_data = executor.submit(get_all_qc_data_with_times, today)
-                logger_data = future_logger_data.result()
-                qc_data, qc_error = future_qc_data.result()
-
-            if qc_error:
-                logging.error(f"IT Dashboard auto-refresh failed: {qc_error}")
-            elif qc_data is None:
-                logging.error("IT Dashboard auto-refresh failed: Failed to fetch QC data")
-            else:
-                # Cache the fresh data
-                cache_logger_data(today, logger_data)
-                cache_qc_data(today, qc_data)
-
-                # Process and cache dashboard data
-                matched_qc_data = {
-                    logger_norm_name: qc_data[max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))]
-                    for logger_norm_name in logger_data
-                    if max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name)) and similarity(logger_norm_name, max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))) >= FUZZY_MATCH_THRESHOLD
-                }
-                
-                dashboard_data = []
-                for norm_name in sorted(logger_data.keys()):
-                    log_info = logger_data[norm_name]
-                    qc_info = matched_qc_data.get(norm_name)
-                    
-                    logger_time = log_info.get('logger_end_time')
-                    if logger_time == "00:00:00":
-                        logger_time = "23:59:59"
-                    qc_time = qc_info.get('last_qc_end_time') if qc_info else None
-
-                    if qc_time and qc_time.startswith("00:00"):
-                        qc_time = "23:59:59"
-
-                    is_tagging_complete = logger_time and logger_time >= TAGGING_COMPLETION_THRESHOLD
-                    is_qc_done = qc_time and qc_time >= "23:30:00"
-
-                    details = {
-                        "channel_name": log_info['original_name'],
-                        "logger_end_time": logger_time or "N/A",
-                        "qc_end_time": qc_time or "Not in QC"
-                    }
-
-                    status_for_sort = ""
-                    if is_qc_done:
-                        status_for_sort = "QC DONE"
-                        details["status_class"] = "status-completed"
-                    elif is_tagging_complete and (qc_time and qc_time >= QC_COMPLETION_THRESHOLD):
-                        status_for_sort = "QC DONE"
-                        details["status_class"] = "status-completed"
-                    elif not is_tagging_complete:
-                        status_for_sort = "Tagging in Progress"
-                        details["status_class"] = "status-progress"
-                    else:
-                        details["status_class"] = "status-eligible"
-                        status_for_sort = "Eligible to Pull (Catch-up)" if qc_info and qc_time else "Eligible to Pull (Default)"
-                    
-                    details["status_for_sort"] = status_for_sort
-                    dashboard_data.append(details)
+    conn = get_db_connection()
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for (dataset, selected_date, scope), weight in pending.items():
+            row = conn.execute('''
+                SELECT demand, (julianday('now') - julianday(updated_at)) * 1440 AS minutes
+                FROM refresh_demand WHERE dataset = ? AND date = ? AND scope = ?
+            ''', (dataset, selected_date, scope)).fetchone()
+            demand = weight + (row['demand'] * 0.5 ** (row['minutes'] / DEMAND_HALF_LIFE_MINUTES) if row else 0)
+            conn.execute('''
+                INSERT INTO refresh_demand (dataset, date, scope, demand, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(dataset, date, scope) DO UPDATE SET demand = excluded.demand, updated_at = CURRENT_TIMESTAMP
+            ''', (dataset, selected_date, scope, demand))
+
+def get_refresh_demand():
+    """Current (decayed) demand per (dataset, date, scope) for today and yesterday"""
+    conn = get_db_connection()
+    rows = conn.execute('''
+        SELECT dataset, date, scope, demand, (julianday('now') - julianday(updated_at)) * 1440 AS minutes
+        FROM refresh_demand WHERE date IN (?, ?)
+    ''', demand_dates()).fetchall()
+    return {(row['dataset'], row['date'], row['scope']): row['demand'] * 0.5 ** (row['minutes'] / DEMAND_HALF_LIFE_MINUTES) for row in rows}
+
+def refresh_priority(cache_age, demand):
+    """Staleness in soft TTLs (a missing snapshot counts as expired) times demand"""
+    staleness = (DASHBOARD_HARD_TTL_SECONDS if cache_age is None else cache_age) / DASHBOARD_SOFT_TTL_SECONDS
+    return staleness * demand
+
+def plan_refreshes():
+    """Stale, wanted (priority, dataset, date, scope) refresh tasks, highest priority first"""
+    tasks = []
+    for (dataset, selected_date, scope), demand in get_refresh_demand().items():
+        if demand < MIN_REFRESH_DEMAND: continue
+        cache_age = get_dashboard_cache_age(selected_date) if dataset == "it" else logger_cluster_cache.age((selected_date, scope))
+        if cache_age is not None and cache_age < DASHBOARD_SOFT_TTL_SECONDS: continue
+        tasks.append((refresh_priority(cache_age, demand), dataset, selected_date, scope))
+    tasks.sort(reverse=True)
+    return tasks[:MAX_REFRESHES_PER_TICK]
+
+def run_refresh_task(dataset, selected_date, scope):
+    """Refresh one dashboard view; returns True on success"""
+    if dataset == "it":
+        _, error_message = run_timed_job("refresh_it", lambda: refresh_it_dashboard(selected_date))
+    else:
+        _, _, error_message = run_timed_job("refresh_logger", lambda: refresh_logger_cluster(selected_date, scope))
+    if error_message:
+        logging.error(f"Scheduled refresh of {dataset} {scope or ''} for {selected_date} failed: {error_message}")
+    return not error_message
+
+def refresh_cluster_progress_from_cache(selected_date):
+    """Recompute a date's cluster progress once every cluster is cached"""
+    clusters = [name for name in CLUSTERS.keys() if name != "All Channels"]
+    cached = {cluster_name: logger_cluster_cache.get((selected_date, cluster_name)) for cluster_name in clusters}
+    if not all(cached.values()): return
+    cache_logger_cluster_progress(selected_date, {
+        cluster_name: calculate_cluster_progress(*value) for cluster_name, (value, _) in cached.items()
+    })
 
-                sort_order = {"Eligible to Pull (Default)": 0, "Eligible to Pull (Catch-up)": 1, "Tagging in Progress": 2, "QC DONE": 3}
-                dashboard_data.sort(key=lambda item: sort_order.get(item['status_for_sort'], 99))
-                
-                # Remove the temporary sort key before caching
-                for item in dashboard_data:
-                    del item['status_for_sort']
-                
-                cache_dashboard_data(today, dashboard_data)
-                logging.info(f"IT Dashboard auto-refresh completed: {len(dashboard_data)} records updated")
+def auto_refresh_cache():
+    """Refresh the most wanted stale dashboard views, highest priority first, on the refresh pool"""
+    try:
+        tasks = plan_refreshes()
+        if not tasks:
+            logging.info("Auto-refresh: no wanted dashboard is stale")
+            return
         
-        # Refresh Logger Dashboard data
-        auto_refresh_logger_data(today)
+        logging.info(f"Auto-refreshing {len(tasks)} dashboards: " + ", ".join(f"{dataset} {selected_date} {scope}".rstrip() + f" ({priority:.1f})" for priority, dataset, selected_date, scope in tasks))
+        run_refresh_tasks([task[1:] for task in tasks])
+        logging.info(f"Upstream client stats: {get_upstream_client_stats()}")
         
     except Exception as e:
         logging.error(f"Auto-refresh error: {str(e)}")
-        import traceback
         traceback.print_exc()
 
-def auto_refresh_logger_data(selected_date):
-    """Automatically refresh logger dashboard data for all clusters"""
-    logging.info(f"Auto-refreshing logger dashboard data for {selected_date}")
-    
-    clusters_to_process = [name for name in CLUSTERS.keys() if name != "All Channels"]
-    cluster_progress = {}
-    
-    for cluster_name in clusters_to_process:
+def run_refresh_tasks(tasks):
+    """Run (dataset, date, scope) refreshes in order on the refresh pool and wait for them"""
+    try:
+        futures = {refresh_executor.submit(run_refresh_task, dataset, selected_date, scope): (dataset, selected_date)
+                   for dataset, selected_date, scope in tasks}
+    except RuntimeError:
+        logging.info("Refresh pool is shut down, skipping the remaining refreshes")
+        return
+    # Refreshes still queued when the server stops are cancelled
+    refreshed_logger_dates = {selected_date for future, (dataset, selected_date) in futures.items()
+                              if not future.cancelled() and future.result() and dataset == "logger"}
+    for selected_date in refreshed_logger_dates:
+        refresh_cluster_progress_from_cache(selected_date)
+
+# --- Cache Warm-Up ---
+# A starting process loads the IT dashboard and logger cluster snapshots of yesterday and
+# today from SQLite into memory. Whichever process becomes scheduler leader prefetches
+# every IT and cluster view of those dates that is missing or stale, and so does the
+# leader just after midnight, when "yesterday" and "today" roll over. The first page load
+# after a deploy or after midnight is then served from the cache.
+DAY_ROLLOVER_PREFETCH_TIME = "00:05"
+
+def live_dates():
+    """Yesterday and today, the dates the dashboards open on and that still change"""
+    today = date.today()
+    return [(today - timedelta(days=1)).isoformat(), today.isoformat()]
+
+def warm_up_caches():
+    """Load the IT dashboard and logger cluster snapshots of the live dates from SQLite into memory"""
+    for selected_date in live_dates():
+        rows = get_cached_dashboard_data(selected_date)
+        if rows:
+            with it_dashboard_lock:
+                it_dashboard_snapshots[selected_date] = (get_dashboard_version(selected_date), {row['channel_name']: row for row in rows})
+        warmed_clusters = [cluster_name for cluster_name in CLUSTERS if logger_cluster_cache.get((selected_date, cluster_name))]
+        logging.info(f"Warmed caches for {selected_date}: IT dashboard with {len(rows)} channels, {len(warmed_clusters)} logger clusters")
+
+def prefetch_live_dates():
+    """Refresh every IT and cluster view of the live dates that is missing or stale.
+    
+    The IT dashboards and "All Channels" go first; they fetch every channel, and writing
+    "All Channels" refreshes every cluster, so only the clusters still stale after it
+    (say, because it failed) are refreshed next.
+    """
+    def stale_views(cluster_names, with_it):
+        views = []
+        for selected_date in live_dates():
+            if with_it and classify_cache_age(selected_date, get_dashboard_cache_age(selected_date)) != "fresh":
+                views.append(("it", selected_date, ""))
+            views.extend(("logger", selected_date, cluster_name) for cluster_name in cluster_names
+                         if classify_cache_age(selected_date, logger_cluster_cache.age((selected_date, cluster_name))) != "fresh")
+        return views
+    
+    first = stale_views(["All Channels"], with_it=True)
+    logging.info(f"Prefetching {len(first)} dashboard views for {', '.join(live_dates())}")
+    run_refresh_tasks(first)
+    then = stale_views([cluster_name for cluster_name in CLUSTERS if cluster_name != "All Channels"], with_it=False)
+    if then:
+        logging.info(f"Prefetching {len(then)} more cluster views")
+    run_refresh_tasks(then)
+
+def schedule_day_rollover_prefetch():
+    """Schedule the prefetch of the new live dates just after midnight"""
+    schedule.every().day.at(DAY_ROLLOVER_PREFETCH_TIME).do(run_timed_job, "day_rollover_prefetch", prefetch_live_dates)
+    logging.info(f"Scheduled day rollover prefetch every day at {DAY_ROLLOVER_PREFETCH_TIME}")
+
+# --- Leader Election ---
+# Every process that starts the scheduler runs its loop, but only the holder of the
+# "scheduler" lease row in SQLite runs the jobs; the others only read the shared cache.
+# The holder renews its lease on a heartbeat thread, so a long refresh doesn't let it
+# lapse, and another process takes over once a dead holder's lease expires.
+SCHEDULER_LEASE_NAME = "scheduler"
+SCHEDULER_HEARTBEAT_SECONDS = 30
+SCHEDULER_LEASE_TTL_SECONDS = 3 * SCHEDULER_HEARTBEAT_SECONDS
+REVALIDATION_LEASE_TTL_SECONDS = 5 * 60  # Upper bound on a background refresh; a crashed refresher's lease frees itself
+_process_token = uuid.uuid4().hex[:8]
+scheduler_is_leader = threading.Event()
+scheduler_stopping = threading.Event()
+scheduler_heartbeat_thread = scheduler_thread = None  # Started by start_scheduler()
+
+def lease_holder_id():
+    """host:pid:token identifying this process (the pid is read each call, so forked workers differ)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{_process_token}"
+
+def acquire_lease(name, ttl_seconds):
+    """Take or renew the named lease for ttl_seconds; True if this process holds it afterwards"""
+    conn = get_db_connection()
+    holder = lease_holder_id()
+    with conn:
+        conn.execute('''
+            INSERT INTO leases (name, holder, acquired_at, renewed_at, expires_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, datetime('now', ?))
+            ON CONFLICT(name) DO UPDATE SET
+                holder = excluded.holder,
+                acquired_at = CASE WHEN holder = excluded.holder THEN acquired_at ELSE excluded.acquired_at END,
+                renewed_at = excluded.renewed_at,
+                expires_at = excluded.expires_at
+            WHERE holder = excluded.holder OR expires_at < datetime('now')
+        ''', (name, holder, f"+{ttl_seconds} seconds"))
+        row = conn.execute("SELECT holder FROM leases WHERE name = ?", (name,)).fetchone()
+    return row['holder'] == holder
+
+def release_lease(name):
+    """Give up the named lease if this process holds it, so another process can take it at once"""
+    conn = get_db_connection()
+    with conn:
+        conn.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, lease_holder_id()))
+
+def release_scheduler_lease():
+    try:
+        release_lease(SCHEDULER_LEASE_NAME)
+    except sqlite3.Error as e:
+        logging.error(f"Could not release the scheduler lease: {e}")
+
+def run_scheduler_heartbeat():
+    """Take or renew the scheduler lease and flush dashboard demand every SCHEDULER_HEARTBEAT_SECONDS"""
+    while not scheduler_stopping.is_set():
         try:
-            # Check if we need to refresh this cluster
-            if not is_logger_data_cached(selected_date, cluster_name) or should_refresh_logger_cache(selected_date, cluster_name):
-                logging.info(f"Auto-refreshing cluster: {cluster_name}")
-                
-                cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(cluster_name, selected_date)
-                
-                if error_message:
-                    logging.error(f"Auto-refresh failed for {cluster_name}: {error_message}")
-                    continue
-                
-                # Cache the fresh data
-                cache_logger_cluster_data(selected_date, cluster_name, cluster_data, low_durn_channels)
-                
-                # Calculate progress
-                total_channels = len(cluster_data)
-                if total_channels > 0:
-                    qced_channels = total_channels - len(low_durn_channels)
-                    percentage = (qced_channels / total_channels * 100)
-                    cluster_progress[cluster_name] = {'total': total_channels, 'qced': qced_channels, 'percentage': round(percentage, 1)}
-                else:
-                    cluster_progress[cluster_name] = {'total': 0, 'qced': 0, 'percentage': 0}
-                
-                logging.info(f"Auto-refreshed {cluster_name}: {total_channels} total, {qced_channels} QCed ({percentage:.1f}%)")
-            else:
-                # Use existing cached data for progress calculation
-                if is_logger_data_cached(selected_date, cluster_name):
-                    cluster_data, low_durn_channels = get_cached_logger_cluster_data(selected_date, cluster_name)
-                    total_channels = len(cluster_data)
-                    if total_channels > 0:
-                        qced_channels = total_channels - len(low_durn_channels)
-                        percentage = (qced_channels / total_channels * 100)
-                        cluster_progress[cluster_name] = {'total': total_channels, 'qced': qced_channels, 'percentage': round(percentage, 1)}
+            is_leader = acquire_lease(SCHEDULER_LEASE_NAME, SCHEDULER_LEASE_TTL_SECONDS)
+        except sqlite3.Error as e:
+            logging.error(f"Scheduler lease heartbeat failed: {e}")
+            is_leader = False
+        try:
+            flush_refresh_demand()
+        except sqlite3.Error as e:
+            logging.error(f"Could not record dashboard demand: {e}")
         
-        except Exception as e:
-            logging.error(f"Auto-refresh error for {cluster_name}: {str(e)}")
-            continue
-    
-    # Also process "All Channels" separately
-    try:
-        if not is_logger_data_cached(selected_date, "All Channels") or should_refresh_logger_cache(selected_date, "All Channels"):
-            logging.info("Auto-refreshing cluster: All Channels")
-            cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster("All Channels", selected_date)
-            
-            if not error_message:
-                cache_logger_cluster_data(selected_date, "All Channels", cluster_data, low_durn_channels)
-                total_channels = len(cluster_data)
-                qced_channels = total_channels - len(low_durn_channels)
-                percentage = (qced_channels / total_channels * 100) if total_channels > 0 else 0
-                cluster_progress["All Channels"] = {'total': total_channels, 'qced': qced_channels, 'percentage': round(percentage, 1)}
-                logging.info(f"Auto-refreshed All Channels: {total_channels} total, {qced_channels} QCed ({percentage:.1f}%)")
-    except Exception as e:
-        logging.error(f"Auto-refresh error for All Channels: {str(e)}")
-    
-    # Cache the progress data
-    if cluster_progress:
-        cache_logger_cluster_progress(selected_date, cluster_progress)
-        logging.info(f"Auto-refreshed cluster progress for {len(cluster_progress)} clusters")
+        if is_leader and not scheduler_is_leader.is_set():
+            logging.info(f"{lease_holder_id()} is now the scheduler leader")
+            scheduler_is_leader.set()
+            # A new leader (a fresh deploy, or a takeover) fills in whatever went stale meanwhile
+            threading.Thread(target=run_timed_job, args=("warm_up_prefetch", prefetch_live_dates), daemon=True).start()
+        elif not is_leader and scheduler_is_leader.is_set():
+            logging.warning(f"{lease_holder_id()} lost the scheduler lease, pausing scheduled jobs")
+            scheduler_is_leader.clear()
+        scheduler_leader.set(int(is_leader))
+        scheduler_stopping.wait(SCHEDULER_HEARTBEAT_SECONDS)
 
 def schedule_cleanup():
     """Schedule the cleanup task to run every Tuesday at 2 AM"""
-    schedule.every().tuesday.at("02:00").do(cleanup_old_data)
+    schedule.every().tuesday.at("02:00").do(run_timed_job, "cleanup", cleanup_old_data)
     logging.info("Scheduled database cleanup for every Tuesday at 2:00 AM")
 
 def schedule_auto_refresh():
-    """Schedule auto-refresh every 20 minutes"""
-    schedule.every(CACHE_REFRESH_MINUTES).minutes.do(auto_refresh_cache)
-    logging.info(f"Scheduled auto-refresh every {CACHE_REFRESH_MINUTES} minutes")
+    """Schedule the demand-driven auto-refresh every REFRESH_TICK_MINUTES"""
+    schedule.every(REFRESH_TICK_MINUTES).minutes.do(run_timed_job, "auto_refresh", auto_refresh_cache)
+    logging.info(f"Scheduled auto-refresh every {REFRESH_TICK_MINUTES} minutes")
 
 def run_scheduler():
-    """Run the scheduler in a separate thread"""
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-
-# Start the scheduler thread
-scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-scheduler_thread.start()
+    """Run the scheduler in a separate thread; jobs only run while this process is the leader"""
+    while not scheduler_stopping.is_set():
+        if scheduler_is_leader.is_set():
+            schedule.run_pending()
+        scheduler_stopping.wait(60)  # Check every minute
+
+def start_scheduler():
+    """Schedule the background jobs and start the scheduler and lease heartbeat threads.
+    
+    Called explicitly by the server entry point, never on import, so tools and tests that
+    import app.py don't refresh upstream data.
+    """
+    global scheduler_heartbeat_thread, scheduler_thread
+    if scheduler_thread is not None: return
+    schedule_cleanup()
+    schedule_auto_refresh()
+    schedule_day_rollover_prefetch()
+    scheduler_heartbeat_thread = threading.Thread(target=run_scheduler_heartbeat, name="scheduler-heartbeat", daemon=True)
+    scheduler_heartbeat_thread.start()
+    scheduler_thread = threading.Thread(target=run_scheduler, name="scheduler", daemon=True)
+    scheduler_thread.start()
+    atexit.register(stop_scheduler)
+
+def stop_scheduler():
+    """Stop scheduling jobs and release the scheduler lease so another process takes over at once"""
+    if scheduler_thread is None or scheduler_stopping.is_set(): return
+    scheduler_stopping.set()
+    schedule.clear()
+    scheduler_heartbeat_thread.join(timeout=SCHEDULER_HEARTBEAT_SECONDS)  # So it can't renew the lease after the release
+    scheduler_is_leader.clear()
+    scheduler_leader.set(0)
+    release_scheduler_lease()
+    logging.info("Scheduler stopped")
 
 # =============================================================================
 # SHARED UTILITY FUNCTIONS
@@ -720,86 +1384,538 @@ def normalize_name(name):
 def similarity(a, b):
     return SequenceMatcher(None, a, b).ratio()
 
+# --- Fuzzy Match Index ---
+# Logger names are matched against every QC name ever seen and the best candidate is
+# stored in SQLite, so each (logger name, QC name) pair is compared at most once.
+_match_index = None  # logger_name -> (best qc_name, score)
+_match_index_qc_names = None  # every QC name the index has been matched against
+_match_index_lock = threading.Lock()
+
+def best_qc_match(logger_name, qc_names):
+    """Return (qc_name, score) for the closest QC name, or (None, 0.0) if there are none"""
+    best_name, best_score = None, 0.0
+    for qc_name in qc_names:
+        score = similarity(logger_name, qc_name)
+        if best_name is None or score > best_score:
+            best_name, best_score = qc_name, score
+    return best_name, best_score
+
+def _load_match_index():
+    """Load the match index from SQLite on first use"""
+    global _match_index, _match_index_qc_names
+    if _match_index is not None:
+        return
+    
+    conn = get_db_connection()
+    rows = conn.execute("SELECT logger_name, qc_name, score FROM channel_match_index").fetchall()
+    _match_index = {row['logger_name']: (row['qc_name'], row['score']) for row in rows}
+    rows = conn.execute("SELECT qc_name FROM channel_match_qc_names").fetchall()
+    _match_index_qc_names = {row['qc_name'] for row in rows}
+
+def _save_match_index(updates, new_qc_names):
+    """Persist changed index entries and newly seen QC names"""
+    conn = get_db_connection()
+    with conn:
+        conn.executemany('''
+            INSERT OR REPLACE INTO channel_match_index (logger_name, qc_name, score, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', [(logger_name, qc_name, score) for logger_name, (qc_name, score) in updates.items()])
+        conn.executemany("INSERT OR IGNORE INTO channel_match_qc_names (qc_name) VALUES (?)",
+                         [(qc_name,) for qc_name in new_qc_names])
+
+def match_logger_to_qc_names(logger_names, qc_names):
+    """Map logger normalized names to their QC normalized names using the persistent match index.
+    
+    Fuzzy matching only runs for logger names the index has never seen, and for known
+    names only against QC names that are new to the index. Names without a match above
+    FUZZY_MATCH_THRESHOLD are left out of the result.
+    """
+    logger_names = list(logger_names)
+    qc_names_today = sorted(set(qc_names))
+    qc_name_set = set(qc_names_today)
+    
+    with _match_index_lock:
+        _load_match_index()
+        updates = {}
+        
+        # Known logger names only need comparing against QC names the index hasn't seen
+        new_qc_names = [name for name in qc_names_today if name not in _match_index_qc_names]
+        if new_qc_names:
+            for logger_name, (qc_name, score) in _match_index.items():
+                candidate, candidate_score = best_qc_match(logger_name, new_qc_names)
+                if candidate is not None and (qc_name is None or candidate_score > score):
+                    updates[logger_name] = (candidate, candidate_score)
+            _match_index_qc_names.update(new_qc_names)
+        
+        known = sum(1 for logger_name in logger_names if logger_name in _match_index)
+        record_cache_lookups("sqlite_channel_match_index", known, len(logger_names) - known)
+        all_qc_names = sorted(_match_index_qc_names)
+        for logger_name in logger_names:
+            if logger_name not in _match_index and logger_name not in updates:
+                updates[logger_name] = best_qc_match(logger_name, all_qc_names)
+        
+        if updates or new_qc_names:
+            _match_index.update(updates)
+            _save_match_index(updates, new_qc_names)
+        
+        entries = {logger_name: _match_index[logger_name] for logger_name in logger_names}
+    
+    matches = {}
+    for logger_name, (qc_name, score) in entries.items():
+        if score < FUZZY_MATCH_THRESHOLD:
+            continue
+        if qc_name not in qc_name_set:
+            # The best match ever seen isn't on today's QC grid, fall back to today's names
+            qc_name, score = best_qc_match(logger_name, qc_names_today)
+            if score < FUZZY_MATCH_THRESHOLD:
+                continue
+        matches[logger_name] = qc_name
+    return matches
+
+# --- Single-Flight Upstream Fetches ---
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution.
+    
+    The first caller runs the function; callers arriving while it is still in flight
+    wait for it and get the same result (or exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+        if not is_leader:
+            logging.info(f"Joining in-flight upstream fetch {key}")
+            return future.result()
+
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+upstream_flights = SingleFlight()
+
+# --- Tiered Cache ---
+class TieredCache:
+    """Memory tier in front of a SQLite tier, written through, with one freshness TTL.
+    
+    Entries carry the time their value was fetched, so an age means the same in both
+    tiers. get() answers from memory while the entry is younger than ttl. Past that it
+    asks SQLite for the age of its copy, which another process may have refreshed, and
+    only reads the rows when that copy is newer than the one in memory.
+    
+    load_age(*key) returns the SQLite copy's age in seconds or None, load(*key) its
+    value, and store(*key, value) writes a value to SQLite.
+    """
+    FETCH_TIME_SLACK_SECONDS = 1  # SQLite timestamps have one-second resolution
+
+    def __init__(self, name, load_age, load, store, ttl, maxsize):
+        self.name = name
+        self.load_age, self.load, self.store = load_age, load, store
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = LRUCache(maxsize=maxsize)  # key -> (value, fetched_at)
+
+    def _memory_entry(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def get(self, key):
+        """(value, age_seconds) from the newest tier, or None if neither holds key"""
+        entry = self._memory_entry(key)
+        if entry and time.time() - entry[1] < self.ttl:
+            record_cache_lookups(f"{self.name}_memory", 1, 0)
+            return entry[0], time.time() - entry[1]
+        record_cache_lookups(f"{self.name}_memory", 0, 1)
+        
+        sqlite_age = self.load_age(*key)
+        record_cache_lookups(f"{self.name}_sqlite", int(sqlite_age is not None), int(sqlite_age is None))
+        if sqlite_age is None: return None
+        fetched_at = time.time() - sqlite_age
+        if entry and entry[1] >= fetched_at - self.FETCH_TIME_SLACK_SECONDS:
+            return entry[0], time.time() - entry[1]
+        
+        value = self.load(*key)
+        with self._lock:
+            self._entries[key] = (value, fetched_at)
+        return value, sqlite_age
+
+    def age(self, key):
+        """Age in seconds of the newest copy of key, without reading SQLite rows; None if neither tier holds it"""
+        entry = self._memory_entry(key)
+        sqlite_age = None if entry and time.time() - entry[1] < self.ttl else self.load_age(*key)
+        ages = [age for age in (entry and time.time() - entry[1], sqlite_age) if age is not None]
+        return min(ages) if ages else None
+
+    def put(self, key, value):
+        """Write a freshly fetched value through to SQLite and memory"""
+        self.store(*key, value)
+        with self._lock:
+            self._entries[key] = (value, time.time())
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries.keys())
+
+    def invalidate(self, prefix=()):
+        """Drop the memory entries whose key starts with prefix, so their next read goes to SQLite"""
+        with self._lock:
+            keys = [key for key in self._entries.keys() if key[:len(prefix)] == prefix]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+# Logger cluster snapshots keyed by (date, cluster_name), valued (cluster_data, low_durn_channels)
+logger_cluster_cache = TieredCache(
+    "logger_clusters",
+    load_age=get_logger_cache_age,
+    load=get_cached_logger_cluster_data,
+    store=lambda selected_date, cluster_name, value: cache_logger_cluster_data(selected_date, cluster_name, *value),
+    ttl=DASHBOARD_SOFT_TTL_SECONDS,
+    maxsize=LOGGER_CLUSTER_CACHE_SIZE,
+)
+
+# --- Background Revalidation ---
+background_refresh_executor = ThreadPoolExecutor(max_workers=MAX_BACKGROUND_REFRESH_WORKERS, thread_name_prefix="revalidate")
+_background_refresh_keys = set()  # Refreshes queued or running, so each key is refreshed once at a time
+_background_refresh_lock = threading.Lock()
+
+def is_live_date(selected_date):
+    """True for today and yesterday, whose dashboards still change as logging and QC catch up"""
+    return selected_date >= (date.today() - timedelta(days=1)).isoformat()
+
+def classify_cache_age(selected_date, cache_age):
+    """Returns "missing", "fresh", "stale" (serve, refresh in the background) or "expired" (refresh first)"""
+    if cache_age is None: return "missing"
+    if not is_live_date(selected_date) or cache_age < DASHBOARD_SOFT_TTL_SECONDS: return "fresh"
+    return "stale" if cache_age < DASHBOARD_HARD_TTL_SECONDS else "expired"
+
+def revalidate_in_background(key, fn, *args):
+    """Run fn(*args) on the background refresh pool unless a refresh for key is already queued or running."""
+    with _background_refresh_lock:
+        if key in _background_refresh_keys: return
+        _background_refresh_keys.add(key)
+
+    def run():
+        # Other processes serving the same stale snapshot skip the refresh while this one holds its lease
+        lease_name = "revalidate:" + ":".join(key)
+        leased = False
+        try:
+            leased = acquire_lease(lease_name, REVALIDATION_LEASE_TTL_SECONDS)
+            if not leased:
+                logging.info(f"Background refresh {key} is already running in another process")
+                return
+            background_revalidations.inc(dashboard=key[0])
+            fn(*args)
+        except Exception as e:
+            logging.error(f"Background refresh {key} failed: {e}")
+        finally:
+            with _background_refresh_lock:
+                _background_refresh_keys.discard(key)
+            if leased:
+                release_lease(lease_name)
+
+    logging.info(f"Serving stale {key}, refreshing in the background")
+    background_refresh_executor.submit(run)
+
+# --- Dashboard Update Events ---
+# Refreshed dashboards are pushed to open pages over Server-Sent Events (/api/events)
+# instead of every page polling the APIs. Each stream holds a server thread, so the
+# number of streams is capped; pages fall back to polling when refused.
+SSE_KEEPALIVE_SECONDS = 20
+SSE_RETRY_MILLISECONDS = 5000
+MAX_EVENT_STREAMS = 20
+EVENT_QUEUE_SIZE = 50
+EVENT_TYPES = ("it_dashboard", "logger_cluster", "logger_progress")
+# Refreshes run in whichever process holds their lease, so each process also watches the
+# views its own streams follow and publishes the ones another process has written
+EVENT_WATCH_SECONDS = 5
+
+class EventSubscription:
+    """One SSE stream's filter (date, optional cluster, event types) and its pending messages."""
+    def __init__(self, selected_date, cluster_name, event_types):
+        self.date = selected_date
+        self.cluster = cluster_name
+        self.event_types = event_types
+        self.messages = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+
+    def matches(self, event, data):
+        if event not in self.event_types or data.get("date") != self.date: return False
+        return self.cluster is None or data.get("cluster") in (None, self.cluster)
+
+    def push(self, message):
+        try:
+            self.messages.put_nowait(message)
+        except queue.Full:
+            # The client has fallen behind; drop what is queued and have it reload instead
+            while True:
+                try: self.messages.get_nowait()
+                except queue.Empty: break
+            self.messages.put_nowait(format_sse("resync", {"date": self.date}))
+
+    def end(self):
+        """Make the stream return after the messages already queued, or at once if it's full"""
+        try:
+            self.messages.put_nowait(None)
+        except queue.Full:
+            while True:
+                try: self.messages.get_nowait()
+                except queue.Empty: break
+            self.messages.put_nowait(None)
+
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+class EventBroker:
+    """Fans dashboard update events out to SSE subscriptions.
+    
+    A payload identical to the last one published for the same topic is dropped, so
+    a refresh that changed nothing costs the subscribers nothing.
+    """
+    def __init__(self, max_subscriptions):
+        self.max_subscriptions = max_subscriptions
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+        self._last_digests = LRUCache(maxsize=256)  # topic -> digest of the last payload
+        self._closed = threading.Event()
+        self._watch_thread = None  # Started with the first subscription
+
+    def subscribe(self, selected_date, cluster_name, event_types):
+        """Returns a new EventSubscription, or None when MAX_EVENT_STREAMS are already open."""
+        with self._lock:
+            if len(self._subscriptions) >= self.max_subscriptions: return None
+            subscription = EventSubscription(selected_date, cluster_name, event_types)
+            self._subscriptions.add(subscription)
+            if self._watch_thread is None:
+                self._watch_thread = threading.Thread(target=self.watch_other_processes, name="event-watch", daemon=True)
+                self._watch_thread.start()
+        event_streams_open.inc()
+        return subscription
+
+    def close(self):
+        """Refuse new streams and end the open ones, for shutdown"""
+        self._closed.set()
+        with self._lock:
+            self.max_subscriptions = 0
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.end()
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription not in self._subscriptions: return
+            self._subscriptions.discard(subscription)
+        event_streams_open.dec()
+
+    def subscribed_views(self):
+        """(dataset, date, scope, weight) of every dashboard view an open stream is following"""
+        clusters = [name for name in CLUSTERS.keys() if name != "All Channels"]
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        views = []
+        for subscription in subscriptions:
+            if "it_dashboard" in subscription.event_types:
+                views.append(("it", subscription.date, "", 1.0))
+            if "logger_cluster" in subscription.event_types and subscription.cluster:
+                views.append(("logger", subscription.date, subscription.cluster, 1.0))
+            if "logger_progress" in subscription.event_types:
+                views.extend(("logger", subscription.date, cluster_name, PROGRESS_DEMAND_WEIGHT) for cluster_name in clusters)
+        return views
+
+    def watched_views(self):
+        """(event, date, cluster) of every view an open stream is following; cluster is None for dates"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        views = set()
+        for subscription in subscriptions:
+            if "it_dashboard" in subscription.event_types:
+                views.add(("it_dashboard", subscription.date, None))
+            if "logger_progress" in subscription.event_types:
+                views.add(("logger_progress", subscription.date, None))
+            if "logger_cluster" in subscription.event_types:
+                cluster_names = [subscription.cluster] if subscription.cluster else list(CLUSTERS)
+                views.update(("logger_cluster", subscription.date, cluster_name) for cluster_name in cluster_names)
+        return views
+
+    def watch_other_processes(self):
+        """Every EVENT_WATCH_SECONDS, publish the watched views whose stored version moved.
+        
+        This process's own writes were published when they happened and are dropped
+        again as identical payloads; a view is only compared from its second look on.
+        """
+        versions = {}
+        while not self._closed.wait(EVENT_WATCH_SECONDS):
+            try:
+                watched = self.watched_views()
+                for view in watched:
+                    version = event_view_version(*view)
+                    if view in versions and version != versions[view]:
+                        self.publish(*event_view_message(*view))
+                    versions[view] = version
+                versions = {view: version for view, version in versions.items() if view in watched}
+            except sqlite3.Error as e:
+                logging.error(f"Could not check dashboard versions for update streams: {e}")
+
+    def publish(self, event, topic, data):
+        message = format_sse(event, data)
+        digest = hashlib.sha1(message.encode("utf-8")).hexdigest()
+        with self._lock:
+            if self._last_digests.get(topic) == digest: return
+            self._last_digests[topic] = digest
+            subscriptions = [subscription for subscription in self._subscriptions if subscription.matches(event, data)]
+        for subscription in subscriptions:
+            subscription.push(message)
+
+def event_view_version(event, selected_date, cluster_name):
+    """The stored version of a view update streams follow: its change log token, or its cache_meta version for progress"""
+    if event == "it_dashboard":
+        return get_change_version("it", selected_date)
+    if event == "logger_cluster":
+        return get_change_version("logger", selected_date, cluster_name)
+    meta = get_cache_meta("logger_progress", selected_date)
+    return meta['version'] if meta else 0
+
+def event_view_message(event, selected_date, cluster_name):
+    """(event, topic, data) for publishing a view as stored, in the shape its writer publishes it"""
+    if event == "it_dashboard":
+        return event, ("it_dashboard", selected_date), {"date": selected_date, "dashboard_data": get_cached_dashboard_data(selected_date)}
+    if event == "logger_cluster":
+        return event, ("logger_cluster", selected_date, cluster_name), {
+            "date": selected_date, "cluster": cluster_name, **logger_cluster_payload(*get_cached_logger_cluster_data(selected_date, cluster_name))}
+    return event, ("logger_progress", selected_date), {"date": selected_date, "progress": get_cached_logger_cluster_progress(selected_date)}
+
+event_broker = EventBroker(MAX_EVENT_STREAMS)
+
 # =============================================================================
 # IT DASHBOARD FUNCTIONS
 # =============================================================================
 
-def fetch_logger_data_chunk(channel_ids, selected_date):
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "StartDateUTC": f"{selected_date}T00:00:00", "EndDateUTC": f"{selected_date}T23:59:59",
-        "SignalIds": [], "ChannelIds": channel_ids
-    }
-    try:
-        response = requests.post(LOGGER_CONFIG["API_URL"], json=payload, headers=headers, timeout=120)
-        return response.json() if response.ok else []
-    except requests.RequestException: return []
-
-def get_all_logger_data(selected_date):
-    channel_ids = LOGGER_CONFIG["ALL_CHANNEL_IDS"]
-    chunks = [channel_ids[i:i + 15] for i in range(0, len(channel_ids), 15)]
-    all_clips = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        results = executor.map(fetch_logger_data_chunk, chunks, [selected_date] * len(chunks))
-        for result in results:
-            if result: all_clips.extend(result)
-    
-    channel_data = defaultdict(lambda: {'original_name': '', 'latest_dt': datetime.min})
-    for clip in all_clips:
-        original_name = clip.get("channelname")
-        normalized = normalize_name(original_name)
+def get_all_logger_data(selected_date, force_refresh=False):
+    """Latest Xen logger end time per normalized channel name, from the shared per-channel cache."""
+    xen_results = get_channel_xen_results(LOGGER_CONFIG["ALL_CHANNEL_IDS"], selected_date, force_refresh)
+    logger_data, latest_end_keys = {}, {}
+    for result in xen_results.values():
+        if not result or result['end'] == "N/A": continue
+        normalized = normalize_name(result['name'])
         if not normalized: continue
+        # Channels sharing a name keep the latest end by date and time, so 00:10 the next day beats 23:50
+        if normalized not in logger_data or result['end_key'] > latest_end_keys[normalized]:
+            logger_data[normalized] = {'original_name': result['name'], 'logger_end_time': result['end']}
+            latest_end_keys[normalized] = result['end_key']
+    return logger_data
+
+def get_fresh_csrf_and_session(force_login=False):
+    """Return a CSRF token for the QC server, logging in only when needed.
+    
+    The token is cached for QC_CSRF_TTL_SECONDS. force_login skips the cache and the
+    session check and logs in again straight away.
+    """
+    with qc_auth_lock:
+        if not force_login and qc_auth["csrf_token"] and time.monotonic() - qc_auth["fetched_at"] < QC_CSRF_TTL_SECONDS:
+            return qc_auth["csrf_token"]
         try:
-            clip_dt = datetime.strptime(f"{clip['ClipEndDate']} {clip['ClipEndTime']}", "%d-%m-%Y %H:%M:%S")
-            if clip_dt > channel_data[normalized]['latest_dt']:
-                channel_data[normalized]['latest_dt'] = clip_dt
-                channel_data[normalized]['original_name'] = original_name
-        except (ValueError, TypeError, KeyError): continue
-    
-    return {
-        norm_name: {'original_name': data['original_name'], 'logger_end_time': data['latest_dt'].strftime("%H:%M:%S")}
-        for norm_name, data in channel_data.items() if data['original_name']
-    }
-
-def get_fresh_csrf_and_session():
-    try:
-        test_response = authenticated_session.get(QC_CONFIG["QC_NEWS_PAGE_URL"], timeout=10, allow_redirects=True)
-        if "/tabsons/login" in test_response.url:
-            login_page = authenticated_session.get(QC_CONFIG["LOGIN_PAGE_URL"])
-            soup = BeautifulSoup(login_page.text, 'html.parser')
-            csrf = soup.find('input', {'name': '_csrf'})['value']
-            payload = {'username': QC_CONFIG["USERNAME"], 'password': QC_CONFIG["PASSWORD"], '_csrf': csrf}
-            authenticated_session.post(QC_CONFIG["PROCESS_LOGIN_URL"], data=payload, timeout=10)
-        
-        qc_page = authenticated_session.get(QC_CONFIG["QC_NEWS_PAGE_URL"])
-        qc_page.raise_for_status()
-        soup = BeautifulSoup(qc_page.text, 'html.parser')
-        return soup.find('input', {'name': '_csrf'})['value']
-    except (requests.RequestException, AttributeError, KeyError): return None
+            qc_page = None if force_login else qc_client.get(QC_CONFIG["QC_NEWS_PAGE_URL"], idempotent=True, allow_redirects=True)
+            if qc_page is None or "/tabsons/login" in qc_page.url:
+                logging.info("Logging in to the QC server")
+                with record_phase("qc_login"):
+                    login_page = qc_client.get(QC_CONFIG["LOGIN_PAGE_URL"], idempotent=True)
+                    soup = BeautifulSoup(login_page.text, 'html.parser')
+                    csrf = soup.find('input', {'name': '_csrf'})['value']
+                    payload = {'username': QC_CONFIG["USERNAME"], 'password': QC_CONFIG["PASSWORD"], '_csrf': csrf}
+                    qc_client.post(QC_CONFIG["PROCESS_LOGIN_URL"], data=payload)
+                    qc_page = qc_client.get(QC_CONFIG["QC_NEWS_PAGE_URL"], idempotent=True)
+            
+            qc_page.raise_for_status()
+            soup = BeautifulSoup(qc_page.text, 'html.parser')
+            qc_auth["csrf_token"] = soup.find('input', {'name': '_csrf'})['value']
+            qc_auth["fetched_at"] = time.monotonic()
+            return qc_auth["csrf_token"]
+        except (requests.RequestException, AttributeError, KeyError, TypeError):
+            qc_auth["csrf_token"] = None
+            return None
+
+def is_qc_auth_rejection(response):
+    """True when the QC server bounced a call to the login page or refused the session/token."""
+    return response.status_code in (401, 403, 419) or "/tabsons/login" in response.url
+
+def qc_post(url, data, call):
+    """POST to a QC data endpoint with the cached CSRF token.
+    
+    If the server rejects the session or token, log in again and retry the call once.
+    call names the endpoint in the upstream metrics ("qc_grid" or "qc_story").
+    Raises QCAuthError when the QC server can't be logged in to.
+    """
+    with record_phase(call), UpstreamCall(call) as upstream_call:
+        response = _qc_post_with_relogin(url, data)
+        if response.status_code >= 400:
+            upstream_call.error(f"HTTP {response.status_code}")
+        return response
+
+def _qc_post_with_relogin(url, data):
+    csrf_token = get_fresh_csrf_and_session()
+    for attempt in range(2):
+        if not csrf_token:
+            raise QCAuthError("Could not log in to the QC server.")
+        headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
+        response = qc_client.post(url, data=data, headers=headers, idempotent=True)
+        if attempt == 1 or not is_qc_auth_rejection(response):
+            return response
+        logging.info(f"QC server rejected the session for {url}, logging in again")
+        with qc_auth_lock:
+            # Another thread may already have logged in again
+            token_changed = qc_auth["csrf_token"] not in (None, csrf_token)
+        csrf_token = get_fresh_csrf_and_session() if token_changed else get_fresh_csrf_and_session(force_login=True)
+    return response
 
 def get_last_qc_clip_time_for_channel(args):
-    normalized_name, channel_info, selected_date, csrf_token = args
+    """Returns (normalized_name, last_clip_time, failed); a failed poll says nothing about the channel."""
+    normalized_name, channel_info, selected_date = args
     date_for_api = datetime.strptime(selected_date, '%Y-%m-%d').strftime('%Y%m%d')
     payload = {
         'draw': '1', 'start': '0', 'length': '1', 'order[0][column]': '2', 'order[0][dir]': 'desc',
         'search_loggerid': channel_info['logger_id'], 'search_datenumber': date_for_api,
         'search_barcchannelcode': channel_info['barc_code'], 'qcedid': '-1', 'fieldname': 'StoryAndHeadlines'
     }
-    headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
     try:
-        response = authenticated_session.post(QC_CONFIG["STORY_DATA_API_URL"], data=payload, headers=headers)
+        response = qc_post(QC_CONFIG["STORY_DATA_API_URL"], payload, "qc_story")
         story_data = json.loads(response.json().get('data', '[]'))
-        return normalized_name, story_data[0].get('clipendtime') if story_data else None
-    except (requests.RequestException, json.JSONDecodeError): return normalized_name, None
+        return normalized_name, story_data[0].get('clipendtime') if story_data else None, False
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        logging.warning(f"QC story poll for {normalized_name} on {selected_date} failed: {e}")
+        return normalized_name, None, True
+
+def is_qc_time_final(last_qc_end_time):
+    """True once a channel's last QC clip makes it QC DONE, after which it can't change status."""
+    return bool(last_qc_end_time) and (last_qc_end_time.startswith("00:00") or last_qc_end_time >= QC_DONE_TIME)
+
+def next_qc_poll_minutes(last_qc_end_time):
+    """Minutes until a not-yet-done channel should be polled again; 0 means every refresh."""
+    if not last_qc_end_time:
+        return QC_POLL_MAX_INTERVAL_MINUTES
+    try:
+        hours, minutes, seconds = (int(part) for part in last_qc_end_time.split(':'))
+        threshold_hours, threshold_minutes, threshold_seconds = (int(part) for part in QC_COMPLETION_THRESHOLD.split(':'))
+    except ValueError:
+        return 0
+    seconds_behind = (threshold_hours * 3600 + threshold_minutes * 60 + threshold_seconds) - (hours * 3600 + minutes * 60 + seconds)
+    return int(min(QC_POLL_MAX_INTERVAL_MINUTES, max(0, seconds_behind / 3600 * QC_POLL_MINUTES_PER_HOUR_BEHIND)))
 
-def get_all_qc_data_with_times(selected_date):
+def get_all_qc_data_with_times(selected_date, force_refresh=False):
     csrf_token = get_fresh_csrf_and_session()
     if not csrf_token: return None, "Could not log in to the QC server."
     date_for_api = datetime.strptime(selected_date, '%Y-%m-%d').strftime('%d/%m/%Y')
     payload = {'search_currentdate': date_for_api}
-    headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
     try:
-        response = authenticated_session.post(QC_CONFIG["CHANNEL_DATA_API_URL"], data=payload, headers=headers)
+        response = qc_post(QC_CONFIG["CHANNEL_DATA_API_URL"], payload, "qc_grid")
         qc_grid_data = response.json().get('qcGridData', [])
     except (requests.RequestException, json.JSONDecodeError) as e:
         return None, f"Error fetching QC channel list: {e}"
@@ -809,73 +1925,336 @@ def get_all_qc_data_with_times(selected_date):
         for row in qc_grid_data if normalize_name(row.get('channelname'))
     }
     qc_data = {}
-    tasks = [(name, info, selected_date, csrf_token) for name, info in channels_on_page.items()]
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        for norm_name, last_clip_time in executor.map(get_last_qc_clip_time_for_channel, tasks):
-            if norm_name: qc_data[norm_name] = {'last_qc_end_time': last_clip_time}
+    poll_state = {} if force_refresh else get_qc_poll_state(selected_date)
+    tasks = []
+    for name, info in channels_on_page.items():
+        last_clip_time, is_due = poll_state.get(name, (None, True))
+        if name in poll_state and (is_qc_time_final(last_clip_time) or not is_due):
+            qc_data[name] = {'last_qc_end_time': last_clip_time}
+        else:
+            tasks.append((name, info, selected_date))
+    
+    if not force_refresh:
+        record_cache_lookups("sqlite_qc_poll_state", len(channels_on_page) - len(tasks), len(tasks))
+    polled_channels, failed_channels = {}, []
+    with record_phase("qc_story"), ThreadPoolExecutor(max_workers=10) as executor:
+        for norm_name, last_clip_time, failed in executor.map(get_last_qc_clip_time_for_channel, tasks):
+            if not norm_name: continue
+            if failed:
+                failed_channels.append(norm_name)
+                continue
+            qc_data[norm_name] = {'last_qc_end_time': last_clip_time}
+            polled_channels[norm_name] = (last_clip_time, 0 if is_qc_time_final(last_clip_time) else next_qc_poll_minutes(last_clip_time))
+    if polled_channels:
+        save_qc_poll_state(selected_date, polled_channels)
+    if failed_channels:
+        # Keep the last known clip time and leave the poll state alone, so the next refresh polls again
+        previous_state = get_qc_poll_state(selected_date) if force_refresh else poll_state
+        for norm_name in failed_channels:
+            qc_data[norm_name] = {'last_qc_end_time': previous_state.get(norm_name, (None, True))[0]}
+    logging.info(f"QC polling for {selected_date}: {len(tasks)} channels polled ({len(failed_channels)} failed), {len(channels_on_page) - len(tasks)} skipped")
     return qc_data, None
 
+# --- IT Dashboard Build Engine ---
+# The last built snapshot per date is kept in memory, so a refresh only reclassifies
+# and writes the channels whose logger or QC end time actually changed.
+IT_DASHBOARD_SORT_ORDER = {"Eligible to Pull (Default)": 0, "Eligible to Pull (Catch-up)": 1, "Tagging in Progress": 2, "QC DONE": 3}
+it_dashboard_snapshots = LRUCache(maxsize=16)  # date -> (version, {channel_name: row})
+it_dashboard_lock = threading.Lock()
+
+def normalize_dashboard_times(logger_time, qc_time):
+    """A channel's logger and QC end times as classify_dashboard_row compares them (midnight ends count as 23:59:59)"""
+    if logger_time == "00:00:00":
+        logger_time = "23:59:59"
+    if qc_time and qc_time.startswith("00:00"):
+        qc_time = "23:59:59"
+    return logger_time, qc_time
+
+def classify_dashboard_row(channel_name, logger_time, qc_time):
+    """Build an IT dashboard row with its status_class from the channel's end times"""
+    logger_time, qc_time = normalize_dashboard_times(logger_time, qc_time)
+
+    is_tagging_complete = logger_time and logger_time >= TAGGING_COMPLETION_THRESHOLD
+    is_qc_done = qc_time and qc_time >= QC_DONE_TIME
+
+    if is_qc_done:
+        status_class = "status-completed"
+    elif is_tagging_complete and (qc_time and qc_time >= QC_COMPLETION_THRESHOLD):
+        status_class = "status-completed"
+    elif not is_tagging_complete:
+        status_class = "status-progress"
+    else:
+        status_class = "status-eligible"
+
+    return {
+        "channel_name": channel_name,
+        "logger_end_time": logger_time or "N/A",
+        "qc_end_time": qc_time or "Not in QC",
+        "status_class": status_class
+    }
+
+def dashboard_status_for_sort(row):
+    """Recover the sort status of a dashboard row from its status_class"""
+    if row['status_class'] == "status-completed":
+        return "QC DONE"
+    if row['status_class'] == "status-progress":
+        return "Tagging in Progress"
+    return "Eligible to Pull (Catch-up)" if row['qc_end_time'] != "Not in QC" else "Eligible to Pull (Default)"
+
+def dashboard_sort_key(row):
+    """Dashboard order: by status, then by normalized channel name"""
+    return (IT_DASHBOARD_SORT_ORDER.get(dashboard_status_for_sort(row), 99), normalize_name(row['channel_name']))
+
+def sort_dashboard_rows(rows):
+    """Sort dashboard rows by status, then by normalized channel name"""
+    return sorted(rows, key=dashboard_sort_key)
+
+def with_sort_keys(rows):
+    """Dashboard rows for the API, carrying their sort_key so clients can re-sort after applying a delta"""
+    return [{**row, "sort_key": dashboard_sort_key(row)} for row in rows]
+
+def build_it_dashboard(selected_date, logger_data, qc_data):
+    """Build the IT dashboard for a date, recomputing only channels whose times changed.
+    
+    The previous snapshot comes from memory, or from dashboard_data when another
+    process has written the date since. Only added, changed and removed rows are
+    written back to the cache.
+    """
+    with record_phase("match"):
+        matched_qc_data = {
+            logger_norm_name: qc_data[qc_name]
+            for logger_norm_name, qc_name in match_logger_to_qc_names(logger_data.keys(), qc_data.keys()).items()
+        }
+
+    with it_dashboard_lock:
+        version, previous = it_dashboard_snapshots.get(selected_date, (None, None))
+        if previous is None or version != get_dashboard_version(selected_date):
+            previous = {row['channel_name']: row for row in get_cached_dashboard_data(selected_date)}
+
+        snapshot, changed_rows = {}, []
+        for norm_name, log_info in logger_data.items():
+            qc_info = matched_qc_data.get(norm_name)
+            channel_name = log_info['original_name']
+            logger_time, qc_time = log_info.get('logger_end_time'), qc_info.get('last_qc_end_time') if qc_info else None
+            # Only classify channels that are new or whose end times changed
+            old_row = previous.get(channel_name)
+            display_logger_time, display_qc_time = normalize_dashboard_times(logger_time, qc_time)
+            if old_row and old_row['logger_end_time'] == (display_logger_time or "N/A") and old_row['qc_end_time'] == (display_qc_time or "Not in QC"):
+                row = old_row
+            else:
+                row = classify_dashboard_row(channel_name, logger_time, qc_time)
+                changed_rows.append(row)
+            snapshot[channel_name] = row
+
+        removed_channel_names = [name for name in previous if name not in snapshot]
+        version = cache_dashboard_data(selected_date, changed_rows, removed_channel_names)
+        it_dashboard_snapshots[selected_date] = (version, snapshot)
+
+    logging.info(f"IT dashboard for {selected_date}: {len(changed_rows)} of {len(snapshot)} channels recomputed")
+    dashboard_data = sort_dashboard_rows(snapshot.values())
+    event_broker.publish("it_dashboard", ("it_dashboard", selected_date), {"date": selected_date, "dashboard_data": dashboard_data})
+    return dashboard_data
+
+def refresh_it_dashboard(selected_date, force_refresh=False):
+    """Fetch logger and QC data for a date and rebuild its IT dashboard.
+    
+    Returns (dashboard_data, error_message). force_refresh bypasses the shared
+    per-channel upstream cache and re-polls every QC channel.
+    """
+    timings = current_phase_timings()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_logger_data = executor.submit(run_with_phase_timings, timings, upstream_flights.do, ("it_logger", selected_date, force_refresh), get_all_logger_data, selected_date, force_refresh)
+        future_qc_data = executor.submit(run_with_phase_timings, timings, upstream_flights.do, ("it_qc", selected_date, force_refresh), get_all_qc_data_with_times, selected_date, force_refresh)
+        logger_data = future_logger_data.result()
+        qc_data, qc_error = future_qc_data.result()
+
+    if qc_error: return None, qc_error
+    if qc_data is None: return None, "Failed to fetch QC data"
+
+    # Cache the raw data
+    cache_logger_data(selected_date, logger_data)
+    cache_qc_data(selected_date, qc_data)
+
+    return build_it_dashboard(selected_date, logger_data, qc_data), None
+
+def revalidate_it_dashboard(selected_date):
+    """Background refresh of a stale IT dashboard snapshot."""
+    dashboard_data, error_message = refresh_it_dashboard(selected_date)
+    if error_message:
+        logging.error(f"Background IT dashboard refresh for {selected_date} failed: {error_message}")
+
 # =============================================================================
 # LOGGER DASHBOARD FUNCTIONS
 # =============================================================================
 
-def process_xen_data(json_data):
-    """Processes Xen data, returning a dict keyed by UNIQUE channel ID."""
-    channel_data = defaultdict(lambda: {'name': '', 'start': datetime.max, 'end': datetime.min})
-    if not isinstance(json_data, list): return {}
-    for clip in json_data:
+def clip_clock_key(time_str):
+    """Returns an HH:MM:SS clip time as an ordered string key, raising ValueError if malformed.
+    
+    Well-formed, in-range values are returned as-is without parsing; anything else goes
+    through strptime so lenient formats (e.g. single-digit fields) still normalize and
+    out-of-range fields raise.
+    """
+    if (len(time_str) == 8 and time_str[2] == ":" and time_str[5] == ":" and (time_str[0:2] + time_str[3:5] + time_str[6:8]).isdigit()
+            and time_str[0:2] < "24" and time_str[3] < "6" and time_str[6] < "6"):
+        return time_str
+    return datetime.strptime(time_str, "%H:%M:%S").strftime("%H:%M:%S")
+
+def clip_time_key(date_str, time_str):
+    """Returns a DD-MM-YYYY date and HH:MM:SS time as an ordered "YYYYMMDD HH:MM:SS" key.
+    
+    Raises ValueError if malformed. The time is the key's last 8 characters. Dates with a
+    month of 01-12 and a day of 01-31 skip parsing; anything else goes through strptime.
+    """
+    if len(date_str) == 10 and date_str[2] == "-" and date_str[5] == "-":
+        day_key = date_str[6:10] + date_str[3:5] + date_str[0:2]
+        if day_key.isdigit() and "01" <= date_str[3:5] <= "12" and "01" <= date_str[0:2] <= "31":
+            return day_key + " " + clip_clock_key(time_str)
+    return datetime.strptime(f"{date_str} {time_str}", "%d-%m-%Y %H:%M:%S").strftime("%Y%m%d %H:%M:%S")
+
+class XenClipReducer:
+    """Folds Xen clips one at a time into per-channel name, earliest start and latest end.
+    
+    Memory stays proportional to the number of channels, not the number of clips.
+    Clip times are compared as ordered string keys and only formatted once per channel.
+    """
+    def __init__(self):
+        self.channel_data = defaultdict(lambda: {'name': '', 'start': None, 'end': None})
+
+    def add(self, clip):
         channel_id = clip.get("ChannelCode")
-        if not channel_id: continue
-        channel_data[channel_id]['name'] = clip.get("channelname", "Unknown")
+        if not channel_id: return
+        channel = self.channel_data[channel_id]
+        channel['name'] = clip.get("channelname", "Unknown")
         start_time_str, start_date_str = clip.get("ClipStartTime"), clip.get("ClipStartDate")
         end_time_str, end_date_str = clip.get("ClipEndTime"), clip.get("ClipEndDate")
-        if not all([start_time_str, start_date_str, end_time_str, end_date_str]): continue
+        if not all([start_time_str, start_date_str, end_time_str, end_date_str]): return
         try:
-            start_dt = datetime.strptime(f"{start_date_str} {start_time_str}", "%d-%m-%Y %H:%M:%S")
-            end_dt = datetime.strptime(f"{end_date_str} {end_time_str}", "%d-%m-%Y %H:%M:%S")
-            if start_dt < channel_data[channel_id]['start']: channel_data[channel_id]['start'] = start_dt
-            if end_dt > channel_data[channel_id]['end']: channel_data[channel_id]['end'] = end_dt
-        except (ValueError, TypeError): continue
-    
-    processed = {}
-    for cid, data in channel_data.items():
-        start_str = data['start'].strftime("%H:%M:%S") if data['start'] != datetime.max else "N/A"
-        end_str = data['end'].strftime("%H:%M:%S") if data['end'] != datetime.min else "N/A"
-        if end_str == "00:00:00": end_str = "23:59:59"
-        processed[cid] = {"name": data['name'], "start": start_str, "end": end_str}
-    return processed
+            start_key = clip_time_key(start_date_str, start_time_str)
+            end_key = clip_time_key(end_date_str, end_time_str)
+        except (ValueError, TypeError): return
+        if channel['start'] is None or start_key < channel['start']: channel['start'] = start_key
+        if channel['end'] is None or end_key > channel['end']: channel['end'] = end_key
+
+    def results(self):
+        """Returns a dict keyed by UNIQUE channel ID with formatted start and end times.
+        
+        end_key is the latest end as a date-qualified clip_time_key, for comparing
+        channels whose last clip ended on different days.
+        """
+        processed = {}
+        for cid, data in self.channel_data.items():
+            start_str = data['start'][-8:] if data['start'] else "N/A"
+            end_str = data['end'][-8:] if data['end'] else "N/A"
+            if end_str == "00:00:00": end_str = "23:59:59"
+            processed[cid] = {"name": data['name'], "start": start_str, "end": end_str, "end_key": data['end']}
+        return processed
+
+def process_xen_data(json_data):
+    """Processes Xen data, returning a dict keyed by UNIQUE channel ID."""
+    if not isinstance(json_data, list): return {}
+    reducer = XenClipReducer()
+    for clip in json_data:
+        reducer.add(clip)
+    return reducer.results()
+
+def iter_json_array(byte_chunks):
+    """Yields the elements of a top-level JSON array as its bytes arrive.
+    
+    Only the current unparsed tail is buffered. Raises ValueError if the document
+    is not an array or ends before the array is closed.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, started = "", False
+
+    def parse(buffer, final):
+        """Returns (unparsed tail, parsed elements, whether the array was closed)."""
+        nonlocal started
+        elements, pos, length = [], 0, len(buffer)
+        while True:
+            while pos < length and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == length:
+                return "", elements, False
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Xen response is not a JSON array")
+                started, pos = True, pos + 1
+                continue
+            if buffer[pos] == "]":
+                return "", elements, True
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final: raise
+                return buffer[pos:], elements, False  # element not complete yet
+            if end == length and not final:
+                return buffer[pos:], elements, False  # a number could still be growing
+            elements.append(element)
+            pos = end
+
+    for chunk in byte_chunks:
+        buffer, elements, closed = parse(buffer + text_decoder.decode(chunk), final=False)
+        yield from elements
+        if closed:
+            return
+    _, elements, closed = parse(buffer + text_decoder.decode(b"", final=True), final=True)
+    yield from elements
+    if not closed:
+        raise ValueError("Xen response ended before the JSON array was closed")
 
 def fetch_xen_chunk(channel_ids, selected_date):
+    """Returns processed Xen data for a chunk of channels, or None if the request failed.
+    
+    The response is streamed and each clip is folded into the per-channel aggregates
+    as it arrives, so the full clip list is never held in memory.
+    """
     payload = {"StartDateUTC": f"{selected_date}T00:00:00", "EndDateUTC": f"{selected_date}T23:59:59", "SignalIds": [], "ChannelIds": channel_ids}
     try:
-        response = requests.post(XEN_API_URL, json=payload, headers={"Content-Type": "application/json"}, timeout=120)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # ExportEPGTabsons is a read-only query, so it is safe to retry
+        with UpstreamCall("xen_chunk"), xen_client.post(XEN_API_URL, json=payload, headers={"Content-Type": "application/json"}, idempotent=True, stream=True) as response:
+            response.raise_for_status()
+            reducer = XenClipReducer()
+            for clip in iter_json_array(response.iter_content(chunk_size=XEN_STREAM_CHUNK_BYTES)):
+                if isinstance(clip, dict): reducer.add(clip)
+            return reducer.results()
+    except (requests.exceptions.RequestException, ValueError) as e:
         logging.error(f"Xen API error: {e}")
-        return []
+        return None
+
+def reduce_eq_clips(all_clips):
+    """Returns (channel_name, {"start", "end"}) for the News clips of an EQ report.
+    
+    Raises ValueError on a malformed clip time.
+    """
+    if not all_clips or not isinstance(all_clips, list): return None, None
+    channel_name = all_clips[0].get("channelname")
+    earliest_start = latest_end = None
+    for clip in all_clips:
+        if clip.get("ProgramType") != "News": continue
+        start_time_str, end_time_str = clip.get("ClipStartTime"), clip.get("ClipEndTime")
+        if not (start_time_str and end_time_str): continue
+        start_key, end_key = clip_clock_key(start_time_str), clip_clock_key(end_time_str)
+        if earliest_start is None or start_key < earliest_start: earliest_start = start_key
+        if latest_end is None or end_key > latest_end: latest_end = end_key
+    if earliest_start is None: return channel_name, None
+    if latest_end == "00:00:00": latest_end = "23:59:59"
+    return channel_name, {"start": earliest_start, "end": latest_end}
 
 def fetch_eq_channel(channel_id, selected_date):
     """Returns (channel_id, channel_name, result_dict)"""
     report_date = datetime.strptime(selected_date, "%Y-%m-%d").strftime("%d-%m-%Y")
     url = EQ_API_URL.format(channel_id=channel_id, date=report_date)
     try:
-        response = requests.get(url, timeout=60)
-        if response.status_code == 500:
-            logging.warning(f"EQ Server HTTP 500 for channel {channel_id}")
-            return channel_id, None, {"error": "Server Failed (500)"}
-        response.raise_for_status()
-        data = response.json()
-        all_clips = data.get("TabsonsReport")
-        if not all_clips or not isinstance(all_clips, list): return channel_id, None, None
-        channel_name = all_clips[0].get("channelname")
-        filtered_clips = [c for c in all_clips if c.get("ProgramType") == "News" and c.get("ClipStartTime") and c.get("ClipEndTime")]
-        if not filtered_clips: return channel_id, channel_name, None
-        start_times = [datetime.strptime(c['ClipStartTime'], "%H:%M:%S") for c in filtered_clips]
-        end_times = [datetime.strptime(c['ClipEndTime'], "%H:%M:%S") for c in filtered_clips]
-        end_time_str = max(end_times).strftime("%H:%M:%S")
-        if end_time_str == "00:00:00": end_time_str = "23:59:59"
-        result = {"start": min(start_times).strftime("%H:%M:%S"), "end": end_time_str}
+        with UpstreamCall("eq_channel") as call:
+            response = eq_client.get(url, idempotent=True)
+            if response.status_code == 500:
+                call.error("HTTP 500")
+                logging.warning(f"EQ Server HTTP 500 for channel {channel_id}")
+                return channel_id, None, {"error": "Server Failed (500)"}
+            response.raise_for_status()
+            data = response.json()
+            channel_name, result = reduce_eq_clips(data.get("TabsonsReport"))
         return channel_id, channel_name, result
     except requests.exceptions.RequestException as e:
         logging.error(f"EQ Network error for {channel_id}: {e}")
@@ -884,38 +2263,117 @@ def fetch_eq_channel(channel_id, selected_date):
         logging.error(f"EQ Invalid data for {channel_id}: {e}")
         return channel_id, None, {"error": "Invalid Data"}
 
-def get_combined_data_for_cluster(cluster_name, selected_date):
-    cache_key = (cluster_name, selected_date)
-    if cache_key in cache:
-        logging.info(f"Cache hit for ({cluster_name}, {selected_date}).")
-        return cache[cache_key]
-    logging.info(f"Fetching new data for cluster: '{cluster_name}' on date: {selected_date}")
-    channel_ids_in_cluster = CLUSTERS.get(cluster_name, [])
-    if not channel_ids_in_cluster: return {}, {}, "Invalid cluster selected."
-    
-    # NEW STRUCTURE: Keyed by unique channel ID
+def get_combined_data_for_cluster(cluster_name, selected_date, force_refresh=False):
+    if cluster_name not in CLUSTERS: return {}, {}, "Invalid cluster selected."
+    return get_combined_data_for_clusters([cluster_name], selected_date, force_refresh)[cluster_name]
+
+def refresh_logger_cluster(selected_date, cluster_name, force_refresh=False):
+    """Fetch a cluster's logger data and write it through the cluster cache unless the fetch failed.
+    
+    Returns (cluster_data, low_durn_channels, error_message). force_refresh also bypasses
+    the shared per-channel upstream results.
+    """
+    cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(cluster_name, selected_date, force_refresh)
+    if not error_message:
+        logger_cluster_cache.put((selected_date, cluster_name), (cluster_data, low_durn_channels))
+    return cluster_data, low_durn_channels, error_message
+
+def get_combined_data_for_clusters(cluster_names, selected_date, force_refresh=False):
+    """Returns {cluster_name: (cluster_data, low_durn_channels, error_message)} fetched for several clusters.
+    
+    The union of their channel IDs goes upstream once and each cluster's view is cut
+    from that per-channel result. Callers read logger_cluster_cache first; this always
+    fetches, from the shared per-channel upstream results unless force_refresh is set.
+    """
+    logging.info(f"Fetching new data for clusters: {list(cluster_names)} on date: {selected_date} (force_refresh: {force_refresh})")
+    channel_ids = tuple(sorted({cid for cluster_name in cluster_names for cid in CLUSTERS[cluster_name]}))
+    # Concurrent requests for the same channels and date share one upstream fetch
+    channel_data = upstream_flights.do(("logger_channels", channel_ids, selected_date, force_refresh), fetch_combined_channel_data, list(channel_ids), selected_date, force_refresh)
+
+    results = {}
+    for cluster_name in cluster_names:
+        members = set(CLUSTERS[cluster_name])
+        cluster_data = {cid: data for cid, data in channel_data.items() if cid in members}
+        results[cluster_name] = (cluster_data, find_low_duration_channels(cluster_data), None)
+    return results
+
+def get_channel_xen_results(channel_ids, selected_date, force_refresh=False):
+    """Returns {channel_id: processed Xen result, or None if the channel had no clips}.
+    
+    Results come from the shared per-channel cache; only missing channels go upstream.
+    Channels from failed chunks are left out and not cached.
+    """
+    results, missing = {}, []
+    with upstream_results_lock:
+        for cid in channel_ids:
+            cache_key = ("xen", cid, selected_date)
+            if not force_refresh and cache_key in upstream_results:
+                results[cid] = upstream_results[cache_key]
+            else:
+                missing.append(cid)
+    if not force_refresh:
+        record_cache_lookups("upstream_results", len(results), len(missing))
+    if not missing:
+        return results
+
+    xen_chunks = [missing[i:i + XEN_CHUNK_SIZE] for i in range(0, len(missing), XEN_CHUNK_SIZE)]
+    with record_phase("xen"), ThreadPoolExecutor(max_workers=MAX_LOGGER_FETCH_WORKERS) as executor:
+        for chunk, processed in zip(xen_chunks, executor.map(fetch_xen_chunk, xen_chunks, [selected_date] * len(xen_chunks))):
+            if processed is None: continue
+            with upstream_results_lock:
+                for cid in chunk:
+                    results[cid] = upstream_results[("xen", cid, selected_date)] = processed.get(cid)
+    return results
+
+def get_channel_eq_results(channel_ids, selected_date, force_refresh=False):
+    """Returns {channel_id: (channel_name, result_dict)} from the shared per-channel cache.
+    
+    Failed EQ fetches are returned but not cached, so the next request retries them.
+    """
+    results, missing = {}, []
+    with upstream_results_lock:
+        for cid in channel_ids:
+            cache_key = ("eq", cid, selected_date)
+            if not force_refresh and cache_key in upstream_results:
+                results[cid] = upstream_results[cache_key]
+            else:
+                missing.append(cid)
+    if not force_refresh:
+        record_cache_lookups("upstream_results", len(results), len(missing))
+    if not missing:
+        return results
+
+    def fetch_eq_channel_politely(cid):
+        time.sleep(EQ_REQUEST_DELAY_SECONDS)
+        return fetch_eq_channel(cid, selected_date)
+
+    with record_phase("eq"), ThreadPoolExecutor(max_workers=MAX_EQ_CONCURRENT_REQUESTS) as executor:
+        for cid, cname, result in executor.map(fetch_eq_channel_politely, missing):
+            results[cid] = (cname, result)
+            if not (result and "error" in result):
+                with upstream_results_lock:
+                    upstream_results[("eq", cid, selected_date)] = (cname, result)
+    return results
+
+def fetch_combined_channel_data(channel_ids, selected_date, force_refresh=False):
+    """Combines Xen and EQ logs for the given channels, keyed by unique channel ID."""
     combined_data = defaultdict(lambda: {"name": "Unknown", "logs": []})
-    eq_semaphore = threading.Semaphore(MAX_EQ_CONCURRENT_REQUESTS)
+    eq_channel_ids = [cid for cid in EQ_CHANNELS if cid in channel_ids]
 
-    def fetch_eq_channel_politely(cid, s_date):
-        with eq_semaphore:
-            time.sleep(EQ_REQUEST_DELAY_SECONDS)
-            return fetch_eq_channel(cid, s_date)
+    timings = current_phase_timings()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        xen_future = executor.submit(run_with_phase_timings, timings, get_channel_xen_results, channel_ids, selected_date, force_refresh)
+        eq_future = executor.submit(run_with_phase_timings, timings, get_channel_eq_results, eq_channel_ids, selected_date, force_refresh)
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        xen_chunks = [channel_ids_in_cluster[i:i + 10] for i in range(0, len(channel_ids_in_cluster), 10)]
-        xen_futures = [executor.submit(fetch_xen_chunk, chunk, selected_date) for chunk in xen_chunks]
-        eq_futures = {executor.submit(fetch_eq_channel_politely, cid, selected_date): cid for cid in EQ_CHANNELS if cid in channel_ids_in_cluster}
-        
-        xen_raw_data = []
-        for future in xen_futures: xen_raw_data.extend(future.result())
-        xen_processed_data = process_xen_data(xen_raw_data)
-        for cid, data in xen_processed_data.items():
+        for cid, data in xen_future.result().items():
+            if not data: continue
             combined_data[cid]['name'] = data['name']
             combined_data[cid]['logs'].append({"logger": "Xen", "start": data['start'], "end": data['end']})
 
-        for future in eq_futures:
-            cid, cname, result = future.result()
+        eq_results = eq_future.result()
+        for cid in eq_channel_ids:
+            if cid not in eq_results: continue
+            cname, result = eq_results[cid]
             if cname: combined_data[cid]['name'] = cname
             
             if result and "error" in result:
@@ -923,17 +2381,53 @@ def get_combined_data_for_cluster(cluster_name, selected_date):
             elif result:
                 combined_data[cid]['logs'].append({"logger": "EQ", **result})
 
-    low_durn_channels = set() # Will store IDs
-    for cid, data in combined_data.items():
+    return dict(combined_data)
+
+def logger_channel_rows(cluster_data, low_durn_channels):
+    """{channel_id: row} as the Logger dashboard's delta responses carry them, logs in a stable order"""
+    return {
+        cid: {
+            "id": cid,
+            "name": data['name'],
+            "logs": sorted(data['logs'], key=lambda log: (log.get('logger', ''), log.get('start', ''), log.get('end', ''))),
+            "low_duration": cid in low_durn_channels,
+        }
+        for cid, data in cluster_data.items()
+    }
+
+def logger_cluster_payload(cluster_data, low_durn_channels):
+    """The cluster data as the Logger dashboard expects it, for the API and update events.
+    
+    Channels and logs are in a stable order, so the same data fetched or read back from
+    SQLite gives the same payload.
+    """
+    rows = logger_channel_rows(cluster_data, low_durn_channels)
+    channel_list = [{"id": cid, "name": rows[cid]['name'], "logs": rows[cid]['logs']} for cid in sorted(rows)]
+    return {
+        'channel_data': channel_list,
+        'low_durn_channels': sorted(low_durn_channels), # Send list of IDs
+        'total_channels': len(channel_list),
+    }
+
+def find_low_duration_channels(cluster_data):
+    """Returns the IDs of channels whose latest logger end time is before 23:00."""
+    low_durn_channels = set()
+    for cid, data in cluster_data.items():
         latest_time = "00:00:00"
         for log in data['logs']:
             end_time = log.get('end', '0')
             if end_time and "Error" not in end_time and end_time > latest_time: latest_time = end_time
         if latest_time < "23:00:00": low_durn_channels.add(cid)
-    
-    result_tuple = (dict(combined_data), low_durn_channels, None)
-    cache[cache_key] = result_tuple
-    return result_tuple
+    return low_durn_channels
+
+def calculate_cluster_progress(cluster_data, low_durn_channels, error_message=None):
+    """Builds a cluster's progress entry for the all-clusters progress API."""
+    total_channels = len(cluster_data)
+    if total_channels == 0:
+        return {'total': 0, 'qced': 0, 'percentage': 0, 'error': error_message or "No channels found"}
+    qced_channels = total_channels - len(low_durn_channels)
+    percentage = (qced_channels / total_channels * 100)
+    return {'total': total_channels, 'qced': qced_channels, 'percentage': round(percentage, 1), 'error': error_message}
 
 # =============================================================================
 # QC DASHBOARD FUNCTIONS
@@ -946,10 +2440,9 @@ def get_channel_data_with_progress(date_for_api):
         return {'error': "Could not log in to the remote server."}, 500
 
     payload = {'search_currentdate': date_for_api}
-    headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
 
     try:
-        response = authenticated_session.post(QC_CONFIG["CHANNEL_DATA_API_URL"], data=payload, headers=headers)
+        response = qc_post(QC_CONFIG["CHANNEL_DATA_API_URL"], payload, "qc_grid")
         response.raise_for_status()
         data = response.json()
         channel_data = data.get('qcGridData', [])
@@ -1075,11 +2568,11 @@ def get_channel_data_with_progress(date_for_api):
 # STATIC FILE ROUTES
 # =============================================================================
 
-@app.route('/favicon.ico')
+@dashboards.route('/favicon.ico')
 def favicon(): 
     return send_from_directory('static', 'favicon.svg', mimetype='image/svg+xml')
 
-@app.route('/static/<path:filename>')
+@dashboards.route('/static/<path:filename>')
 def static_files(filename): 
     return send_from_directory('static', filename)
 
@@ -1087,7 +2580,7 @@ def static_files(filename):
 # MAIN NAVIGATION ROUTE
 # =============================================================================
 
-@app.route('/')
+@dashboards.route('/')
 def index():
     """Main dashboard navigation page"""
     return render_template('index.html')
@@ -1096,102 +2589,65 @@ def index():
 # IT DASHBOARD ROUTES
 # =============================================================================
 
-@app.route("/it-dashboard", methods=["GET", "POST"])
+@dashboards.route("/it-dashboard", methods=["GET", "POST"])
 def it_dashboard_page():
     selected_date = request.form.get("date", (date.today() - timedelta(days=1)).isoformat())
     return render_template("it_dashboard.html", selected_date=selected_date)
 
-@app.route("/dashboard_data_api", methods=["POST"])
+@dashboards.route("/dashboard_data_api", methods=["POST"])
 def dashboard_data_api():
     selected_date = request.form.get("selected_date")
     force_refresh = request.form.get("force_refresh", "false").lower() == "true"
+    since = None if force_refresh else parse_version_token(request.form.get("since"))
     if not selected_date:
         return jsonify({"error": "Missing selected_date parameter."}), 400
         
-    logging.info(f"IT Dashboard API request for {selected_date} (force_refresh: {force_refresh})")
+    logging.info(f"IT Dashboard API request for {selected_date} (force_refresh: {force_refresh}, since: {since})")
+    record_demand("it", selected_date)
     
     try:
-        # Check if we should force refresh or use cached data
-        if force_refresh or not is_data_cached(selected_date):
+        # Read the version before the rows, so a concurrent write is sent again rather than missed
+        version = get_change_version("it", selected_date)
+        
+        # Serve the cached snapshot unless it is missing, expired or a force refresh was asked for
+        cache_age = None if force_refresh else get_dashboard_cache_age(selected_date)
+        freshness = classify_cache_age(selected_date, cache_age)
+        if not force_refresh:
+            record_cache_lookups("sqlite_dashboard_data", int(freshness != "missing"), int(freshness == "missing"))
+        if force_refresh or freshness in ("missing", "expired"):
             if force_refresh:
                 logging.info(f"Force refresh requested for IT dashboard on {selected_date}")
             else:
-                logging.info(f"No cached data found for {selected_date}, fetching fresh data")
-            
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                future_logger_data = executor.submit(get_all_logger_data, selected_date)
-                future_qc_data = executor.submit(get_all_qc_data_with_times, selected_date)
-                logger_data = future_logger_data.result()
-                qc_data, qc_error = future_qc_data.result()
-
-            if qc_error: return jsonify({"error": qc_error}), 500
-            if qc_data is None: return jsonify({"error": "Failed to fetch QC data"}), 500
-
-            # Cache the raw data
-            cache_logger_data(selected_date, logger_data)
-            cache_qc_data(selected_date, qc_data)
-
-            matched_qc_data = {
-                logger_norm_name: qc_data[max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))]
-                for logger_norm_name in logger_data
-                if max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name)) and similarity(logger_norm_name, max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))) >= FUZZY_MATCH_THRESHOLD
-            }
-            
-            dashboard_data = []
-            for norm_name in sorted(logger_data.keys()):
-                log_info = logger_data[norm_name]
-                qc_info = matched_qc_data.get(norm_name)
-                
-                logger_time = log_info.get('logger_end_time')
-                if logger_time == "00:00:00":
-                    logger_time = "23:59:59"
-                qc_time = qc_info.get('last_qc_end_time') if qc_info else None
-
-                if qc_time and qc_time.startswith("00:00"):
-                    qc_time = "23:59:59"
-
-                is_tagging_complete = logger_time and logger_time >= TAGGING_COMPLETION_THRESHOLD
-                is_qc_done = qc_time and qc_time >= "23:30:00"
-
-                details = {
-                    "channel_name": log_info['original_name'],
-                    "logger_end_time": logger_time or "N/A",
-                    "qc_end_time": qc_time or "Not in QC"
-                }
-
-                status_for_sort = ""
-                if is_qc_done:
-                    status_for_sort = "QC DONE"
-                    details["status_class"] = "status-completed"
-                elif is_tagging_complete and (qc_time and qc_time >= QC_COMPLETION_THRESHOLD):
-                    status_for_sort = "QC DONE"
-                    details["status_class"] = "status-completed"
-                elif not is_tagging_complete:
-                    status_for_sort = "Tagging in Progress"
-                    details["status_class"] = "status-progress"
-                else:
-                    details["status_class"] = "status-eligible"
-                    status_for_sort = "Eligible to Pull (Catch-up)" if qc_info and qc_time else "Eligible to Pull (Default)"
-                
-                details["status_for_sort"] = status_for_sort
-                dashboard_data.append(details)
-
-            sort_order = {"Eligible to Pull (Default)": 0, "Eligible to Pull (Catch-up)": 1, "Tagging in Progress": 2, "QC DONE": 3}
-            dashboard_data.sort(key=lambda item: sort_order.get(item['status_for_sort'], 99))
-            
-            # Remove the temporary sort key before sending the response
-            for item in dashboard_data:
-                del item['status_for_sort']
-            
-            # Cache the processed dashboard data
-            cache_dashboard_data(selected_date, dashboard_data)
+                logging.info(f"No usable cached data for {selected_date} ({freshness}), fetching fresh data")
             
-            return jsonify({"dashboard_data": dashboard_data})
+            dashboard_data, error_message = refresh_it_dashboard(selected_date, force_refresh)
+            if not error_message:
+                return conditional_json({"dashboard_data": with_sort_keys(dashboard_data), "version": version, "full": True,
+                                         "cache_age_seconds": 0, "revalidating": False})
+            if cache_age is None: return jsonify({"error": error_message}), 500
+            logging.warning(f"IT dashboard refresh for {selected_date} failed, serving expired cache: {error_message}")
+        elif freshness == "stale":
+            revalidate_in_background(("it_dashboard", selected_date), revalidate_it_dashboard, selected_date)
         else:
-            # Use cached data
             logging.info(f"Using cached data for {selected_date}")
-            cached_data = get_cached_dashboard_data(selected_date)
-            return jsonify({"dashboard_data": cached_data})
+        
+        response_meta = {"cache_age_seconds": round(cache_age), "revalidating": freshness == "stale"}
+        changes = None if since is None else get_dashboard_changes("it", selected_date, "", since)
+        if changes is not None:
+            upserted_rows, removed_channel_names, version = changes
+            return conditional_json({
+                "changes": {"upserted": with_sort_keys(upserted_rows), "removed": removed_channel_names},
+                "version": version,
+                "full": False,
+                **response_meta,
+            })
+        
+        return conditional_json({
+            "dashboard_data": with_sort_keys(get_cached_dashboard_data(selected_date)),
+            "version": version,
+            "full": True,
+            **response_meta,
+        })
     
     except Exception as e:
         print(f"Unexpected error in dashboard API: {str(e)}")
@@ -1202,48 +2658,65 @@ def dashboard_data_api():
 # LOGGER DASHBOARD ROUTES
 # =============================================================================
 
-@app.route("/logger-dashboard")
+@dashboards.route("/logger-dashboard")
 def logger_dashboard():
     yesterday = (date.today() - timedelta(days=1)).isoformat()
     return render_template("logger_dashboard.html", clusters=CLUSTERS.keys(), selected_date=yesterday, selected_cluster="All Channels")
 
-@app.route("/api/dashboard_data")
+@dashboards.route("/api/dashboard_data")
 def logger_dashboard_data_api():
     selected_date = request.args.get('date', (date.today() - timedelta(days=1)).isoformat())
     selected_cluster = request.args.get('cluster', 'All Channels')
     force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
-    logging.info(f"API request for cluster: '{selected_cluster}' on date: {selected_date} (force_refresh: {force_refresh})")
+    since = None if force_refresh else parse_version_token(request.args.get('since'))
+    logging.info(f"API request for cluster: '{selected_cluster}' on date: {selected_date} (force_refresh: {force_refresh}, since: {since})")
+    record_demand("logger", selected_date, selected_cluster)
 
     try:
-        # Check if we should force refresh or use cached data
-        if force_refresh or not is_logger_data_cached(selected_date, selected_cluster):
+        # Read the version before the rows, so a concurrent write is sent again rather than missed
+        version = get_change_version("logger", selected_date, selected_cluster)
+        
+        # Serve the cached snapshot unless it is missing, expired or a force refresh was asked for
+        cached = None if force_refresh else logger_cluster_cache.get((selected_date, selected_cluster))
+        cache_age = cached[1] if cached else None
+        freshness = classify_cache_age(selected_date, cache_age)
+        cluster_data = None
+        if force_refresh or freshness in ("missing", "expired"):
             if force_refresh:
                 logging.info(f"Force refresh requested for {selected_cluster} on {selected_date}")
             else:
-                logging.info(f"No cached data found for {selected_cluster} on {selected_date}, fetching fresh data")
-            
-            cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(selected_cluster, selected_date)
+                logging.info(f"No usable cached data for {selected_cluster} on {selected_date} ({freshness}), fetching fresh data")
             
-            # Cache the fresh data if no error occurred
-            if not error_message:
-                cache_logger_cluster_data(selected_date, selected_cluster, cluster_data, low_durn_channels)
+            cluster_data, low_durn_channels, error_message = refresh_logger_cluster(selected_date, selected_cluster, force_refresh)
+            if error_message and cache_age is not None:
+                logging.warning(f"Refresh of {selected_cluster} on {selected_date} failed, serving expired cache: {error_message}")
+                cluster_data = None
+            else:
+                cache_age = 0
+        elif freshness == "stale":
+            revalidate_in_background(("logger_cluster", selected_date, selected_cluster), refresh_logger_cluster, selected_date, selected_cluster)
         else:
-            # Use cached data
             logging.info(f"Using cached logger data for {selected_cluster} on {selected_date}")
-            cluster_data, low_durn_channels = get_cached_logger_cluster_data(selected_date, selected_cluster)
-            error_message = None
         
-        # NEW: Convert dict to a list of objects for the client
-        channel_list = []
-        for cid, data in cluster_data.items():
-            channel_list.append({
-                "id": cid,
-                "name": data['name'],
-                "logs": data['logs'],
-            })
+        revalidating = freshness == "stale" and not force_refresh
+        if cluster_data is None:
+            changes = None if since is None else get_dashboard_changes("logger", selected_date, selected_cluster, since)
+            if changes is not None:
+                upserted_rows, removed_channel_ids, version = changes
+                return conditional_json({
+                    'changes': {'upserted': upserted_rows, 'removed': removed_channel_ids},
+                    'version': version,
+                    'full': False,
+                    'error_message': None,
+                    'cache_age_seconds': round(cache_age),
+                    'revalidating': revalidating
+                })
+            (cluster_data, low_durn_channels), error_message = cached[0], None
+        
+        payload = logger_cluster_payload(cluster_data, low_durn_channels)
 
         # Check if we have any data
-        if not channel_list:
+        if not payload['channel_data']:
             return jsonify({
                 'channel_data': [],
                 'low_durn_channels': [],
@@ -1252,11 +2725,13 @@ def logger_dashboard_data_api():
                 'is_empty': True
             }), 404
 
-        return jsonify({
-            'channel_data': channel_list,
-            'low_durn_channels': list(low_durn_channels), # Send list of IDs
+        return conditional_json({
+            **payload,
+            'version': version,
+            'full': True,
             'error_message': error_message,
-            'total_channels': len(channel_list)
+            'cache_age_seconds': round(cache_age),
+            'revalidating': revalidating
         })
     
     except Exception as e:
@@ -1269,121 +2744,65 @@ def logger_dashboard_data_api():
             'is_error': True
         }), 500
 
-@app.route("/api/all_clusters_progress")
+@dashboards.route("/api/all_clusters_progress")
 def all_clusters_progress_api():
     selected_date = request.args.get('date', (date.today() - timedelta(days=1)).isoformat())
     force_refresh = request.args.get('force_refresh', 'false').lower() == 'true'
     clusters_to_check = [name for name in CLUSTERS.keys() if name != "All Channels"]
     
     logging.info(f"Cluster progress API request for {selected_date} (force_refresh: {force_refresh})")
+    for cluster_name in clusters_to_check:
+        record_demand("logger", selected_date, cluster_name, PROGRESS_DEMAND_WEIGHT)
     
     try:
         # Check if we should force refresh or use cached data
         if force_refresh:
             logging.info(f"Force refresh requested for cluster progress on {selected_date}")
             cluster_progress = {}
+            fetched = get_combined_data_for_clusters(clusters_to_check, selected_date, force_refresh=True)
             for cluster_name in clusters_to_check:
-                cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(cluster_name, selected_date)
+                cluster_data, low_durn_channels, error_message = fetched[cluster_name]
                 
                 # Only cache if no error occurred
                 if not error_message:
-                    cache_logger_cluster_data(selected_date, cluster_name, cluster_data, low_durn_channels)
+                    logger_cluster_cache.put((selected_date, cluster_name), (cluster_data, low_durn_channels))
                 
-                total_channels = len(cluster_data)
-                if total_channels > 0:
-                    qced_channels = total_channels - len(low_durn_channels)
-                    percentage = (qced_channels / total_channels * 100)
-                    cluster_progress[cluster_name] = {
-                        'total': total_channels,
-                        'qced': qced_channels,
-                        'percentage': round(percentage, 1),
-                        'error': error_message
-                    }
-                else:
-                    cluster_progress[cluster_name] = {
-                        'total': 0,
-                        'qced': 0,
-                        'percentage': 0,
-                        'error': error_message or "No channels found"
-                    }
+                cluster_progress[cluster_name] = calculate_cluster_progress(cluster_data, low_durn_channels, error_message)
             
             # Cache the progress data
             cache_logger_cluster_progress(selected_date, cluster_progress)
         else:
             # Check if we have cached progress data for all clusters
-            all_clusters_cached = all(is_logger_data_cached(selected_date, cluster_name) for cluster_name in clusters_to_check)
+            cached_clusters = {}
+            for cluster_name in clusters_to_check:
+                cached = logger_cluster_cache.get((selected_date, cluster_name))
+                if cached: cached_clusters[cluster_name] = cached[0]
             
-            if all_clusters_cached:
+            if len(cached_clusters) == len(clusters_to_check):
                 logging.info(f"Using cached cluster progress for {selected_date}")
                 cluster_progress = get_cached_logger_cluster_progress(selected_date)
-                
-                # If we don't have complete progress data, fetch missing clusters
-                if len(cluster_progress) < len(clusters_to_check):
-                    logging.info(f"Some cluster progress missing, fetching missing data for {selected_date}")
-                    for cluster_name in clusters_to_check:
-                        if cluster_name not in cluster_progress:
-                            if is_logger_data_cached(selected_date, cluster_name):
-                                cluster_data, low_durn_channels = get_cached_logger_cluster_data(selected_date, cluster_name)
-                                error_message = None
-                            else:
-                                cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(cluster_name, selected_date)
-                                # Only cache if no error occurred
-                                if not error_message:
-                                    cache_logger_cluster_data(selected_date, cluster_name, cluster_data, low_durn_channels)
-                            
-                            total_channels = len(cluster_data)
-                            if total_channels > 0:
-                                qced_channels = total_channels - len(low_durn_channels)
-                                percentage = (qced_channels / total_channels * 100)
-                                cluster_progress[cluster_name] = {
-                                    'total': total_channels,
-                                    'qced': qced_channels,
-                                    'percentage': round(percentage, 1),
-                                    'error': error_message
-                                }
-                            else:
-                                cluster_progress[cluster_name] = {
-                                    'total': 0,
-                                    'qced': 0,
-                                    'percentage': 0,
-                                    'error': error_message or "No channels found"
-                                }
-                    
-                    # Cache the complete progress data
-                    cache_logger_cluster_progress(selected_date, cluster_progress)
             else:
-                # Only fetch fresh data for clusters that don't have cached data
                 logging.info(f"Some clusters not cached, fetching missing data for {selected_date}")
                 cluster_progress = {}
-                for cluster_name in clusters_to_check:
-                    if is_logger_data_cached(selected_date, cluster_name):
-                        cluster_data, low_durn_channels = get_cached_logger_cluster_data(selected_date, cluster_name)
-                        error_message = None
-                    else:
-                        cluster_data, low_durn_channels, error_message = get_combined_data_for_cluster(cluster_name, selected_date)
+            
+            # Fill in clusters without progress, fetching the uncached ones in one go
+            missing_clusters = [cluster_name for cluster_name in clusters_to_check if cluster_name not in cluster_progress]
+            if missing_clusters:
+                clusters_to_fetch = [cluster_name for cluster_name in missing_clusters if cluster_name not in cached_clusters]
+                fetched = get_combined_data_for_clusters(clusters_to_fetch, selected_date) if clusters_to_fetch else {}
+                
+                for cluster_name in missing_clusters:
+                    if cluster_name in fetched:
+                        cluster_data, low_durn_channels, error_message = fetched[cluster_name]
                         # Only cache if no error occurred
                         if not error_message:
-                            cache_logger_cluster_data(selected_date, cluster_name, cluster_data, low_durn_channels)
-                    
-                    total_channels = len(cluster_data)
-                    if total_channels > 0:
-                        qced_channels = total_channels - len(low_durn_channels)
-                        percentage = (qced_channels / total_channels * 100)
-                        cluster_progress[cluster_name] = {
-                            'total': total_channels,
-                            'qced': qced_channels,
-                            'percentage': round(percentage, 1),
-                            'error': error_message
-                        }
+                            logger_cluster_cache.put((selected_date, cluster_name), (cluster_data, low_durn_channels))
                     else:
-                        cluster_progress[cluster_name] = {
-                            'total': 0,
-                            'qced': 0,
-                            'percentage': 0,
-                            'error': error_message or "No channels found"
-                        }
+                        (cluster_data, low_durn_channels), error_message = cached_clusters[cluster_name], None
+                    
+                    cluster_progress[cluster_name] = calculate_cluster_progress(cluster_data, low_durn_channels, error_message)
                 
-                # Cache the progress data
+                # Cache the complete progress data
                 cache_logger_cluster_progress(selected_date, cluster_progress)
         
         # Check if we have any data
@@ -1393,7 +2812,7 @@ def all_clusters_progress_api():
                 'is_empty': True
             }), 404
         
-        return jsonify(cluster_progress)
+        return conditional_json(cluster_progress)
     
     except Exception as e:
         logging.error(f"Error in all_clusters_progress_api: {str(e)}")
@@ -1406,7 +2825,7 @@ def all_clusters_progress_api():
 # QC DASHBOARD ROUTES
 # =============================================================================
 
-@app.route("/qc-dashboard", methods=['GET', 'POST'])
+@dashboards.route("/qc-dashboard", methods=['GET', 'POST'])
 def qc_dashboard():
     selected_date_str = None
     if request.method == 'POST':
@@ -1419,7 +2838,7 @@ def qc_dashboard():
     # The main page now only renders the shell, not the data
     return render_template('qc_dashboard.html', selected_date=selected_date_str)
 
-@app.route('/channel_data_api', methods=['POST'])
+@dashboards.route('/channel_data_api', methods=['POST'])
 def qc_channel_data_api():
     selected_date_str = request.form.get('selected_date')
     if not selected_date_str:
@@ -1432,10 +2851,12 @@ def qc_channel_data_api():
         return jsonify({'error': 'Invalid date format.'}), 400
     
     data, status_code = get_channel_data_with_progress(date_for_api)
+    if status_code == 200:
+        return conditional_json(data)
 
     return jsonify(data), status_code
 
-@app.route('/last_clip_times')
+@dashboards.route('/last_clip_times')
 def qc_last_clip_times():
     """API endpoint to get the last clip start and end times for a channel."""
     selected_date_str = request.args.get('date')
@@ -1459,10 +2880,9 @@ def qc_last_clip_times():
         'search_loggerid': logger_id, 'search_datenumber': date_for_api,
         'search_barcchannelcode': barc_code, 'qcedid': '-1', 'fieldname': 'StoryAndHeadlines'
     }
-    headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
 
     try:
-        response = authenticated_session.post(QC_CONFIG["STORY_DATA_API_URL"], data=story_payload, headers=headers)
+        response = qc_post(QC_CONFIG["STORY_DATA_API_URL"], story_payload, "qc_story")
         response.raise_for_status()
         data = response.json()
         
@@ -1481,7 +2901,7 @@ def qc_last_clip_times():
     except (requests.RequestException, json.JSONDecodeError) as e:
         return jsonify({'error': f'An error occurred: {e}'}), 500
 
-@app.route('/stories')
+@dashboards.route('/stories')
 def qc_stories():
     selected_date_str = request.args.get('date')
     barc_code = request.args.get('barc_code')
@@ -1504,10 +2924,9 @@ def qc_stories():
         'search_loggerid': logger_id, 'search_datenumber': date_for_api,
         'search_barcchannelcode': barc_code, 'qcedid': '-1', 'fieldname': 'StoryAndHeadlines'
     }
-    headers = {'X-CSRF-TOKEN': csrf_token, 'X-Requested-With': 'XMLHttpRequest'}
 
     try:
-        response = authenticated_session.post(QC_CONFIG["STORY_DATA_API_URL"], data=story_payload, headers=headers)
+        response = qc_post(QC_CONFIG["STORY_DATA_API_URL"], story_payload, "qc_story")
         response.raise_for_status()
         data = response.json()
         
@@ -1526,15 +2945,193 @@ def qc_stories():
     except (requests.RequestException, json.JSONDecodeError) as e:
         return f"Error fetching story data: {e}<br>Response: {response.text}", 500
 
-if __name__ == "__main__":
-    # Initialize the database
+# =============================================================================
+# DIAGNOSTICS ROUTES
+# =============================================================================
+
+@dashboards.before_app_request
+def track_request_start():
+    http_requests_in_flight.inc()
+    g.request_started = time.perf_counter()
+    g.phase_timings = PhaseTimings()
+
+@dashboards.after_app_request
+def add_request_timing(response):
+    timings, started = g.get("phase_timings"), g.get("request_started")
+    if timings is None or started is None:
+        return response
+    total_seconds = time.perf_counter() - started
+    if request.endpoint in SERVER_TIMING_ENDPOINTS:
+        response.headers["Server-Timing"] = server_timing_header(timings, total_seconds)
+    if total_seconds >= SLOW_REQUEST_THRESHOLD_SECONDS:
+        logging.warning("slow_request " + json.dumps({
+            "method": request.method, "path": request.path, "args": request.args.to_dict() or request.form.to_dict(),
+            "status": response.status_code, "duration_ms": round(total_seconds * 1000, 1), "phases": timings.as_dict(),
+        }))
+    return response
+
+@dashboards.teardown_app_request
+def track_request_end(exc):
+    http_requests_in_flight.dec()
+
+@dashboards.after_app_request
+def gzip_json_response(response):
+    if response.mimetype != "application/json" or response.direct_passthrough or "Content-Encoding" in response.headers:
+        return response
+    response.vary.add("Accept-Encoding")
+    if response.status_code != 200 or not request.accept_encodings["gzip"]:
+        return response
+    body = response.get_data()
+    if len(body) >= GZIP_MIN_BYTES:
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+    return response
+
+@dashboards.route("/api/events")
+def dashboard_events_api():
+    """Server-Sent Events stream of dashboard updates for a date (and optionally one cluster)."""
+    selected_date = request.args.get('date', (date.today() - timedelta(days=1)).isoformat())
+    cluster_name = request.args.get('cluster')
+    event_types = {name for name in request.args.get('types', ",".join(EVENT_TYPES)).split(",") if name in EVENT_TYPES}
+    subscription = event_broker.subscribe(selected_date, cluster_name, event_types)
+    if subscription is None:
+        return jsonify({"error": "Too many open update streams, poll the dashboard APIs instead."}), 503
+
+    def stream():
+        try:
+            yield f"retry: {SSE_RETRY_MILLISECONDS}\n\n"
+            while True:
+                try:
+                    message = subscription.messages.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if message is None: return  # The server is shutting down
+                yield message
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@dashboards.route("/api/upstream_stats")
+def upstream_stats_api():
+    """Connection pool reuse, retries and failures for each upstream client."""
+    return jsonify(get_upstream_client_stats())
+
+@dashboards.route("/metrics")
+def metrics_api():
+    """Upstream latency and errors, cache hit ratios, scheduler durations and in-flight requests, in Prometheus text format."""
+    return current_app.response_class(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+# =============================================================================
+# APP FACTORY AND SERVER
+# =============================================================================
+
+# Every open update stream holds a waitress thread, so the default thread count leaves
+# WAITRESS_POLLER_THREADS for the page and polling APIs on top of MAX_EVENT_STREAMS.
+WAITRESS_POLLER_THREADS = 12
+WAITRESS_CONNECTION_LIMIT = 200
+WAITRESS_CHANNEL_TIMEOUT_SECONDS = 120  # Idle connections are closed after this; update streams send a keepalive every SSE_KEEPALIVE_SECONDS
+WAITRESS_DRAIN_TIMEOUT_SECONDS = 30  # On shutdown, how long in-flight requests get to finish and flush
+server_stopping = threading.Event()
+
+def create_app():
+    """Build the dashboards app: initialize the database, warm the caches and register the routes.
+    
+    The scheduler is not started here; the server entry point starts it with start_scheduler().
+    """
+    flask_app = Flask(__name__)
+    flask_app.register_blueprint(dashboards)
     init_database()
-    
-    # Schedule the cleanup task
-    schedule_cleanup()
-    
-    # Schedule the auto-refresh task
-    schedule_auto_refresh()
-    
-    logging.info("Starting Unified Dashboard Application on http://0.0.0.0:5000")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    warm_up_caches()
+    return flask_app
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the IT, Logger and QC dashboards")
+    parser.add_argument("--host", default="0.0.0.0", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=5000, help="port to listen on")
+    parser.add_argument("--threads", type=int, default=MAX_EVENT_STREAMS + WAITRESS_POLLER_THREADS, help="waitress worker threads")
+    parser.add_argument("--connection-limit", type=int, default=WAITRESS_CONNECTION_LIMIT, help="open connections accepted at once")
+    parser.add_argument("--channel-timeout", type=int, default=WAITRESS_CHANNEL_TIMEOUT_SECONDS, help="seconds before an idle connection is closed")
+    parser.add_argument("--drain-timeout", type=float, default=WAITRESS_DRAIN_TIMEOUT_SECONDS, help="seconds in-flight requests get to finish on shutdown")
+    parser.add_argument("--no-scheduler", action="store_true", help="don't run background refreshes in this process")
+    parser.add_argument("--dev", action="store_true", help="use Flask's debug server instead of waitress")
+    return parser.parse_args(argv)
+
+def server_socket_map(server):
+    """The asyncore map waitress polls: its listening sockets, connections and trigger"""
+    return server.map if hasattr(server, "map") else server._map
+
+def handle_shutdown_signal(server):
+    """SIGTERM/SIGINT handler: stop accepting connections and end the update streams.
+    
+    The serving loop keeps running so in-flight requests finish and their responses are
+    flushed; a second signal stops it at once.
+    """
+    def shut_down(signum, frame):
+        if server_stopping.is_set():
+            logging.warning(f"Received signal {signum} again, stopping without draining")
+            raise SystemExit(1)
+        logging.info(f"Received signal {signum}, shutting down")
+        server_stopping.set()
+        for listener in server_socket_map(server).values():
+            if isinstance(listener, BaseWSGIServer):
+                listener.accepting = False  # No longer polled; serve_until_drained closes the socket
+        event_broker.close()
+    return shut_down
+
+def is_server_drained(server):
+    """True once no request is running or queued and every response has been written out"""
+    dispatcher = server.task_dispatcher
+    if dispatcher.active_count or dispatcher.queue: return False
+    return not any(isinstance(channel, HTTPChannel) and channel.total_outbufs_len
+                   for channel in list(server_socket_map(server).values()))
+
+def serve_until_drained(server, drain_timeout):
+    """Run waitress's loop until a shutdown signal, then until in-flight requests are done or drain_timeout passes"""
+    socket_map = server_socket_map(server)
+    deadline = None
+    while socket_map:
+        wasyncore.loop(timeout=server.adj.asyncore_loop_timeout, map=socket_map, use_poll=server.adj.asyncore_use_poll, count=1)
+        if not server_stopping.is_set(): continue
+        if deadline is None:
+            deadline = time.monotonic() + drain_timeout
+            for listener in [dispatcher for dispatcher in socket_map.values() if isinstance(dispatcher, BaseWSGIServer)]:
+                wasyncore.dispatcher.close(listener)  # Only the listening socket; the trigger still wakes the loop
+        if is_server_drained(server):
+            break
+        if time.monotonic() >= deadline:
+            logging.warning(f"{server.task_dispatcher.active_count} request(s) still running after {drain_timeout}s, stopping anyway")
+            break
+    server.task_dispatcher.shutdown()
+    wasyncore.close_all(socket_map)
+
+def main(argv=None):
+    args = parse_args(argv)
+    flask_app = create_app()
+    if not args.no_scheduler:
+        start_scheduler()
+
+    if args.dev:
+        logging.info(f"Starting Unified Dashboard Application (debug server) on http://{args.host}:{args.port}")
+        flask_app.run(host=args.host, port=args.port, debug=True, use_reloader=False, threaded=True)
+        return
+
+    server = create_server(flask_app, host=args.host, port=args.port, threads=args.threads,
+                           connection_limit=args.connection_limit, channel_timeout=args.channel_timeout,
+                           ident="dashboards")
+    shut_down = handle_shutdown_signal(server)
+    signal.signal(signal.SIGTERM, shut_down)
+    signal.signal(signal.SIGINT, shut_down)
+    logging.info(f"Starting Unified Dashboard Application on http://{args.host}:{args.port} "
+                 f"({args.threads} threads, {args.connection_limit} connections)")
+    try:
+        serve_until_drained(server, args.drain_timeout)
+    finally:
+        stop_scheduler()
+        background_refresh_executor.shutdown(wait=False, cancel_futures=True)
+        refresh_executor.shutdown(wait=False, cancel_futures=True)
+        logging.info("Unified Dashboard Application stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark logger -> QC channel name matching.
+
+Compares the previous per-refresh fuzzy matching (three `max(..., key=similarity)`
+scans per logger name) against the persistent match index, cold (empty index) and
+warm (index already populated by an earlier day).
+
+    python benchmarks/bench_channel_matching.py --channels 100 --days 3
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def make_channel_names(count, seed):
+    """Build logger names plus slightly different QC spellings, like the real grids"""
+    rng = random.Random(seed)
+    words = ["news", "tv", "live", "india", "bharat", "times", "samachar", "24x7", "zee", "aaj",
+             "network", "express", "today", "public", "state", "channel", "plus", "one"]
+    logger_names, qc_names = [], []
+    for i in range(count):
+        name = " ".join(rng.sample(words, rng.randint(2, 4))) + f" {i}"
+        logger_names.append(name)
+        qc_name = name if rng.random() < 0.6 else name + " " + rng.choice(["new", "hd", "tv"])
+        qc_names.append(qc_name)
+    # QC grids carry a few channels the loggers don't
+    for _ in range(count // 10):
+        qc_names.append("".join(rng.choices(string.ascii_lowercase, k=12)))
+    return logger_names, qc_names
+
+
+def legacy_match(logger_data, qc_data):
+    similarity, threshold = app.similarity, app.FUZZY_MATCH_THRESHOLD
+    return {
+        logger_norm_name: qc_data[max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))]
+        for logger_norm_name in logger_data
+        if max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name)) and similarity(logger_norm_name, max(qc_data.keys(), key=lambda qc_name: similarity(logger_norm_name, qc_name))) >= threshold
+    }
+
+
+def indexed_match(logger_data, qc_data):
+    return {
+        logger_norm_name: qc_data[qc_name]
+        for logger_norm_name, qc_name in app.match_logger_to_qc_names(logger_data.keys(), qc_data.keys()).items()
+    }
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=100, help="logger channels per day")
+    parser.add_argument("--days", type=int, default=3, help="days to match after the cold run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app.DB_PATH = os.path.join(tmp_dir, "bench.db")
+        app.init_database()
+
+        logger_names, qc_names = make_channel_names(args.channels, seed=1)
+        logger_data = {name: {} for name in logger_names}
+        qc_data = {name: {"last_qc_end_time": "23:40:00"} for name in qc_names}
+
+        legacy, legacy_seconds = timed(legacy_match, logger_data, qc_data)
+        cold, cold_seconds = timed(indexed_match, logger_data, qc_data)
+        assert cold == legacy, "match index disagrees with the legacy matcher"
+
+        warm_seconds = []
+        for _ in range(args.days):
+            warm, seconds = timed(indexed_match, logger_data, qc_data)
+            assert warm == legacy
+            warm_seconds.append(seconds)
+        warm_avg = sum(warm_seconds) / len(warm_seconds)
+
+        print(f"channels: {len(logger_names)} logger / {len(qc_names)} QC")
+        print(f"legacy fuzzy match : {legacy_seconds * 1000:10.2f} ms")
+        print(f"index, cold        : {cold_seconds * 1000:10.2f} ms ({legacy_seconds / cold_seconds:.1f}x)")
+        print(f"index, warm (avg)  : {warm_avg * 1000:10.2f} ms ({legacy_seconds / warm_avg:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
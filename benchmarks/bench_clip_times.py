@@ -0,0 +1,114 @@
+"""Benchmark clip timestamp reduction for the Xen and EQ reducers.
+
+Builds a synthetic day of clips and compares the previous strptime-based
+reductions against the ordered-string-key reducers in app.py.
+
+    python benchmarks/bench_clip_times.py --clips 100000 --channels 100
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def make_xen_clips(clip_count, channel_count, seed):
+    rng = random.Random(seed)
+    clips = []
+    for _ in range(clip_count):
+        channel = rng.randrange(channel_count)
+        start = rng.randrange(0, 86400 - 600)
+        end = start + rng.randrange(30, 600)
+        clips.append({
+            "ChannelCode": str(1010000 + channel),
+            "channelname": f"Channel {channel}",
+            "ClipStartDate": "17-10-2026",
+            "ClipStartTime": f"{start // 3600:02d}:{start // 60 % 60:02d}:{start % 60:02d}",
+            "ClipEndDate": "17-10-2026",
+            "ClipEndTime": f"{end // 3600:02d}:{end // 60 % 60:02d}:{end % 60:02d}",
+            "ProgramType": "News" if rng.random() < 0.9 else "Ad",
+        })
+    return clips
+
+
+def legacy_process_xen_data(json_data):
+    """process_xen_data as it was before the string-key reducer"""
+    channel_data = defaultdict(lambda: {'name': '', 'start': datetime.max, 'end': datetime.min})
+    for clip in json_data:
+        channel_id = clip.get("ChannelCode")
+        if not channel_id: continue
+        channel_data[channel_id]['name'] = clip.get("channelname", "Unknown")
+        start_time_str, start_date_str = clip.get("ClipStartTime"), clip.get("ClipStartDate")
+        end_time_str, end_date_str = clip.get("ClipEndTime"), clip.get("ClipEndDate")
+        if not all([start_time_str, start_date_str, end_time_str, end_date_str]): continue
+        try:
+            start_dt = datetime.strptime(f"{start_date_str} {start_time_str}", "%d-%m-%Y %H:%M:%S")
+            end_dt = datetime.strptime(f"{end_date_str} {end_time_str}", "%d-%m-%Y %H:%M:%S")
+            if start_dt < channel_data[channel_id]['start']: channel_data[channel_id]['start'] = start_dt
+            if end_dt > channel_data[channel_id]['end']: channel_data[channel_id]['end'] = end_dt
+        except (ValueError, TypeError): continue
+
+    processed = {}
+    for cid, data in channel_data.items():
+        start_str = data['start'].strftime("%H:%M:%S") if data['start'] != datetime.max else "N/A"
+        end_str = data['end'].strftime("%H:%M:%S") if data['end'] != datetime.min else "N/A"
+        if end_str == "00:00:00": end_str = "23:59:59"
+        processed[cid] = {"name": data['name'], "start": start_str, "end": end_str}
+    return processed
+
+
+def legacy_reduce_eq_clips(all_clips):
+    """The EQ reduction from fetch_eq_channel before reduce_eq_clips"""
+    channel_name = all_clips[0].get("channelname")
+    filtered_clips = [c for c in all_clips if c.get("ProgramType") == "News" and c.get("ClipStartTime") and c.get("ClipEndTime")]
+    if not filtered_clips: return channel_name, None
+    start_times = [datetime.strptime(c['ClipStartTime'], "%H:%M:%S") for c in filtered_clips]
+    end_times = [datetime.strptime(c['ClipEndTime'], "%H:%M:%S") for c in filtered_clips]
+    end_time_str = max(end_times).strftime("%H:%M:%S")
+    if end_time_str == "00:00:00": end_time_str = "23:59:59"
+    return channel_name, {"start": min(start_times).strftime("%H:%M:%S"), "end": end_time_str}
+
+
+def best_of(repeats, fn, *args):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=100000, help="clips in the synthetic day")
+    parser.add_argument("--channels", type=int, default=100, help="channels the clips are spread over")
+    parser.add_argument("--repeats", type=int, default=3, help="runs per variant, best is reported")
+    args = parser.parse_args()
+
+    clips = make_xen_clips(args.clips, args.channels, seed=7)
+
+    legacy_xen, legacy_xen_seconds = best_of(args.repeats, legacy_process_xen_data, clips)
+    new_xen, new_xen_seconds = best_of(args.repeats, app.process_xen_data, clips)
+    new_xen_times = {cid: {k: v for k, v in result.items() if k != "end_key"} for cid, result in new_xen.items()}
+    assert new_xen_times == legacy_xen, "Xen reducer disagrees with the strptime version"
+
+    # EQ reports are per channel, so reduce the same clips as one large report
+    legacy_eq, legacy_eq_seconds = best_of(args.repeats, legacy_reduce_eq_clips, clips)
+    new_eq, new_eq_seconds = best_of(args.repeats, app.reduce_eq_clips, clips)
+    assert new_eq == legacy_eq, "EQ reducer disagrees with the strptime version"
+
+    print(f"clips: {len(clips)} over {args.channels} channels")
+    print(f"Xen strptime reducer : {legacy_xen_seconds * 1000:9.1f} ms")
+    print(f"Xen string-key       : {new_xen_seconds * 1000:9.1f} ms ({legacy_xen_seconds / new_xen_seconds:.1f}x)")
+    print(f"EQ strptime reducer  : {legacy_eq_seconds * 1000:9.1f} ms")
+    print(f"EQ string-key        : {new_eq_seconds * 1000:9.1f} ms ({legacy_eq_seconds / new_eq_seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
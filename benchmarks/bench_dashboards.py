@@ -0,0 +1,187 @@
+"""Benchmark the dashboard APIs against local Xen, EQ and QC stand-in servers.
+
+Times /dashboard_data_api, /api/dashboard_data, /api/all_clusters_progress and
+/channel_data_api on a cold start (empty SQLite database and in-memory caches)
+and then on warm caches, and saves the results as JSON so runs can be compared.
+
+    python benchmarks/bench_dashboards.py --clips-per-channel 1000 --latency-ms 20
+    python benchmarks/bench_dashboards.py --baseline benchmarks/results/<earlier run>.json
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from standin_servers import StandinUpstreams  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def dashboard_requests(selected_date):
+    """(name, method, path, params) for each API the dashboards poll"""
+    return [
+        ("dashboard_data_api", "POST", "/dashboard_data_api", {"selected_date": selected_date}),
+        ("api_dashboard_data", "GET", "/api/dashboard_data", {"date": selected_date, "cluster": "All Channels"}),
+        ("api_all_clusters_progress", "GET", "/api/all_clusters_progress", {"date": selected_date}),
+        ("channel_data_api", "POST", "/channel_data_api", {"selected_date": selected_date}),
+    ]
+
+
+def synthetic_clusters(channel_count):
+    """Spread channel_count made-up channel IDs over the app's five clusters"""
+    cluster_names = [name for name in app.CLUSTERS if name != "All Channels"]
+    clusters = {name: [] for name in cluster_names}
+    for i in range(channel_count):
+        clusters[cluster_names[i % len(cluster_names)]].append(str(2010000 + i))
+    all_channels = sorted(channel_id for channel_ids in clusters.values() for channel_id in channel_ids)
+    clusters["All Channels"] = all_channels
+    return clusters, all_channels[:max(1, channel_count // 7)]
+
+
+def use_standin_upstreams(upstreams):
+    urls = upstreams.app_urls()
+    app.XEN_API_URL = app.LOGGER_CONFIG["API_URL"] = urls["XEN_API_URL"]
+    app.EQ_API_URL = urls["EQ_API_URL"]
+    qc_base = urls["QC_BASE_URL"]
+    app.QC_CONFIG.update({
+        "BASE_URL": qc_base,
+        "LOGIN_PAGE_URL": f"{qc_base}/login",
+        "PROCESS_LOGIN_URL": f"{qc_base}/process-login",
+        "QC_NEWS_PAGE_URL": f"{qc_base}/qcnews",
+        "CHANNEL_DATA_API_URL": f"{qc_base}/qcnews/getdatagrid",
+        "STORY_DATA_API_URL": f"{qc_base}/qcnews/getstorydatagrid",
+    })
+
+
+def reset_app_state(db_path):
+    """Start from an empty database and empty in-memory caches, logged out of QC"""
+    app.DB_PATH = db_path
+    app.init_database()
+    app.logger_cluster_cache.invalidate()
+    with app.upstream_results_lock:
+        app.upstream_results.clear()
+    with app.it_dashboard_lock:
+        app.it_dashboard_snapshots.clear()
+    with app._match_index_lock:
+        app._match_index = app._match_index_qc_names = None
+    with app.qc_auth_lock:
+        app.qc_auth.update(csrf_token=None, fetched_at=0.0)
+        app.authenticated_session.cookies.clear()
+
+
+def timed_request(client, method, path, params):
+    started = time.perf_counter()
+    if method == "POST":
+        response = client.post(path, data=params)
+    else:
+        response = client.get(path, query_string=params)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return response.status_code, len(response.get_data()), elapsed_ms
+
+
+def run_benchmark(selected_date, warm_runs, tmp_dir):
+    app.DB_PATH = os.path.join(tmp_dir, "app.db")  # create_app() initializes the database it points at
+    client = app.create_app().test_client()
+    results = {}
+    for name, method, path, params in dashboard_requests(selected_date):
+        # Every endpoint gets its own cold start so none benefits from another's fetches
+        reset_app_state(os.path.join(tmp_dir, f"{name}.db"))
+        cold_status, cold_bytes, cold_ms = timed_request(client, method, path, params)
+        warm = [timed_request(client, method, path, params) for _ in range(warm_runs)]
+        warm_ms = [elapsed for _, _, elapsed in warm]
+        results[name] = {
+            "method": method,
+            "path": path,
+            "cold_ms": round(cold_ms, 2),
+            "cold_status": cold_status,
+            "response_bytes": cold_bytes,
+            "warm_ms": {
+                "min": round(min(warm_ms), 2),
+                "median": round(statistics.median(warm_ms), 2),
+                "max": round(max(warm_ms), 2),
+            } if warm_ms else None,
+            "warm_statuses": sorted({status for status, _, _ in warm}),
+        }
+        logging.getLogger("bench").info(f"{name}: cold {cold_ms:.1f} ms")
+    return results
+
+
+def print_results(run, baseline=None):
+    baseline_endpoints = (baseline or {}).get("endpoints", {})
+    print(f"{'endpoint':28} {'cold ms':>10} {'warm median':>12} {'status':>7}")
+    for name, result in run["endpoints"].items():
+        warm_median = result["warm_ms"]["median"] if result["warm_ms"] else float("nan")
+        line = f"{name:28} {result['cold_ms']:10.1f} {warm_median:12.2f} {result['cold_status']:7}"
+        previous = baseline_endpoints.get(name)
+        if previous:
+            line += f"   cold {previous['cold_ms'] / max(result['cold_ms'], 0.001):.2f}x vs baseline"
+            if previous.get("warm_ms") and result["warm_ms"]:
+                line += f", warm {previous['warm_ms']['median'] / max(warm_median, 0.001):.2f}x"
+        print(line)
+    print("upstream requests:", json.dumps(run["upstream_requests"], sort_keys=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--date", default=(date.today() - timedelta(days=1)).isoformat(), help="dashboard date (YYYY-MM-DD)")
+    parser.add_argument("--channels", type=int, default=0, help="synthetic channel count (default: the app's own channel lists)")
+    parser.add_argument("--clips-per-channel", type=int, default=500, help="clips per channel per day from Xen and EQ")
+    parser.add_argument("--latency-ms", type=float, default=20, help="latency added to every upstream data request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of upstream data requests that fail")
+    parser.add_argument("--warm-runs", type=int, default=5, help="warm-cache requests per endpoint")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/dashboards-<timestamp>.json)")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--verbose", action="store_true", help="keep the app's INFO logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    if args.channels:
+        app.CLUSTERS, app.EQ_CHANNELS = synthetic_clusters(args.channels)
+        app.LOGGER_CONFIG["ALL_CHANNEL_IDS"] = app.CLUSTERS["All Channels"]
+
+    config = {
+        "date": args.date,
+        "channels": len(app.CLUSTERS["All Channels"]),
+        "clips_per_channel": args.clips_per_channel,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "warm_runs": args.warm_runs,
+    }
+    with StandinUpstreams(app.CLUSTERS, clips_per_channel=args.clips_per_channel,
+                          latency_ms=args.latency_ms, error_rate=args.error_rate) as upstreams:
+        use_standin_upstreams(upstreams)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            endpoints = run_benchmark(args.date, args.warm_runs, tmp_dir)
+        run = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "config": config,
+            "endpoints": endpoints,
+            "upstream_requests": upstreams.request_counts,
+            "upstream_clients": app.get_upstream_client_stats(),
+        }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"dashboards-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(run, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(run, baseline)
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Local stand-ins for the Xen, EQ and QC upstreams, for offline benchmarks.
+
+Each upstream runs as its own threaded HTTP server on 127.0.0.1 so the app's
+per-upstream connection pools behave as they do in production:
+
+- Xen: POST /command/ExportEPGTabsons
+- EQ:  GET  /api/tabsons/getreport/<channel_id>/<dd-mm-YYYY>
+- QC:  GET /tabsons/login, POST /tabsons/process-login, GET /tabsons/qcnews,
+       POST /tabsons/qcnews/getdatagrid and /tabsons/qcnews/getstorydatagrid
+
+Responses are generated deterministically from the channel ID, date and seed,
+with configurable clip volume, per-request latency and error rate.
+"""
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_STANDIN_CONFIG = {
+    "clips_per_channel": 500,  # Clips per channel per day, for both Xen and EQ
+    "latency_ms": 20,  # Added to every data request
+    "error_rate": 0.0,  # Share of data requests answered with error_status
+    "error_status": 503,
+    "seed": 7,
+}
+
+# QC cluster IDs as get_channel_data_with_progress expects them
+QC_CLUSTER_IDS = {"All East": 1, "All Hindi Regional": 2, "All National": 3, "All South": 4, "All West": 5}
+
+
+def channel_name(channel_id):
+    return f"Channel {channel_id}"
+
+
+def format_clock(seconds):
+    seconds = max(0, min(seconds, 86399))
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class StandinData:
+    """Deterministic clips, QC grid rows and QC end times per (channel, day)"""
+    def __init__(self, config, clusters):
+        self.config = config
+        self.channel_clusters = {}
+        for cluster_name, channel_ids in clusters.items():
+            for channel_id in channel_ids:
+                self.channel_clusters.setdefault(channel_id, QC_CLUSTER_IDS.get(cluster_name))
+
+    def _rng(self, *parts):
+        return random.Random(":".join(str(part) for part in (self.config["seed"],) + parts))
+
+    def logger_end_seconds(self, channel_id, day):
+        # Most channels finish late in the evening, a few are still being tagged
+        return self._rng("end", channel_id, day).randint(17 * 3600, 86399)
+
+    def clips(self, channel_id, day):
+        """Back-to-back clips from midnight to the channel's logger end time"""
+        count = max(1, self.config["clips_per_channel"])
+        end = self.logger_end_seconds(channel_id, day)
+        rng = self._rng("clips", channel_id, day)
+        step = end / count
+        clips = []
+        for i in range(count):
+            clips.append((format_clock(int(i * step)), format_clock(int((i + 1) * step)),
+                          "News" if rng.random() < 0.9 else "Ad"))
+        return clips
+
+    def qc_end_time(self, channel_id, day):
+        lag = self._rng("qc", channel_id, day).randint(0, 3 * 3600)
+        return format_clock(self.logger_end_seconds(channel_id, day) - lag)
+
+    def qc_grid_row(self, channel_id, day):
+        rng = self._rng("grid", channel_id, day)
+        return {
+            "channelname": channel_name(channel_id),
+            "barcchannelcode": channel_id,
+            "loggerid": f"{channel_id}01",
+            "clusterid": self.channel_clusters.get(channel_id) or 3,
+            "totltime": format_clock(self.logger_end_seconds(channel_id, day)),
+            "pendqcrec": rng.randint(0, 300),
+        }
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real upstreams
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def upstreams(self):
+        return self.server.upstreams
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, body=b"", content_type="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data).encode("utf-8"))
+
+    def _simulate_upstream(self):
+        """Apply latency and return True if this request should fail"""
+        config = self.upstreams.config
+        if config["latency_ms"]:
+            time.sleep(config["latency_ms"] / 1000)
+        if config["error_rate"] and random.random() < config["error_rate"]:
+            self._send(config["error_status"])
+            return True
+        return False
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.upstreams.count(self.server.name, path)
+        self.server.handle_get(self, path)
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        self.upstreams.count(self.server.name, path)
+        body = self._body()
+        self.server.handle_post(self, path, body)
+
+
+class XenServer(ThreadingHTTPServer):
+    name = "xen"
+    daemon_threads = True
+
+    def handle_get(self, handler, path):
+        handler._send(404)
+
+    def handle_post(self, handler, path, body):
+        if path != "/command/ExportEPGTabsons":
+            return handler._send(404)
+        if handler._simulate_upstream():
+            return
+        payload = json.loads(body or b"{}")
+        day = datetime.strptime(payload["StartDateUTC"][:10], "%Y-%m-%d").strftime("%d-%m-%Y")
+        clips = []
+        for channel_id in payload.get("ChannelIds", []):
+            name = channel_name(channel_id)
+            for start, end, program_type in self.upstreams.data.clips(channel_id, day):
+                clips.append({
+                    "ChannelCode": channel_id, "channelname": name, "ProgramType": program_type,
+                    "ClipStartDate": day, "ClipStartTime": start, "ClipEndDate": day, "ClipEndTime": end,
+                })
+        handler._send_json(clips)
+
+
+class EQServer(ThreadingHTTPServer):
+    name = "eq"
+    daemon_threads = True
+
+    def handle_get(self, handler, path):
+        parts = path.strip("/").split("/")
+        if parts[:3] != ["api", "tabsons", "getreport"] or len(parts) != 5:
+            return handler._send(404)
+        if handler._simulate_upstream():
+            return
+        channel_id, day = parts[3], parts[4]
+        name = channel_name(channel_id)
+        report = [
+            {"channelname": name, "ProgramType": program_type, "ClipStartTime": start, "ClipEndTime": end}
+            for start, end, program_type in self.upstreams.data.clips(channel_id, day)
+        ]
+        handler._send_json({"TabsonsReport": report})
+
+    def handle_post(self, handler, path, body):
+        handler._send(404)
+
+
+class QCServer(ThreadingHTTPServer):
+    """Session cookie + CSRF token login flow; unauthenticated calls redirect to /tabsons/login"""
+    name = "qc"
+    daemon_threads = True
+
+    def _session_token(self, handler):
+        cookies = handler.headers.get("Cookie") or ""
+        for cookie in cookies.split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == "SESSION":
+                with self.upstreams.lock:
+                    return self.upstreams.qc_sessions.get(value)
+        return None
+
+    def _redirect_to_login(self, handler):
+        handler._send(302, headers=[("Location", "/tabsons/login")])
+
+    def _csrf_page(self, handler, token):
+        page = f'<html><body><form><input type="hidden" name="_csrf" value="{token}"></form></body></html>'
+        handler._send(200, page.encode("utf-8"), content_type="text/html")
+
+    def handle_get(self, handler, path):
+        if path == "/tabsons/login":
+            return self._csrf_page(handler, "login-token")
+        if path == "/tabsons/qcnews":
+            token = self._session_token(handler)
+            return self._csrf_page(handler, token) if token else self._redirect_to_login(handler)
+        handler._send(404)
+
+    def handle_post(self, handler, path, body):
+        form = {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()}
+        if path == "/tabsons/process-login":
+            session_id, token = uuid.uuid4().hex, uuid.uuid4().hex
+            with self.upstreams.lock:
+                self.upstreams.qc_sessions[session_id] = token
+            return handler._send(200, b"", headers=[("Set-Cookie", f"SESSION={session_id}; Path=/tabsons")])
+        if path not in ("/tabsons/qcnews/getdatagrid", "/tabsons/qcnews/getstorydatagrid"):
+            return handler._send(404)
+        token = self._session_token(handler)
+        if not token or handler.headers.get("X-CSRF-TOKEN") != token:
+            return self._redirect_to_login(handler)
+        if handler._simulate_upstream():
+            return
+
+        data = self.upstreams.data
+        if path.endswith("/getdatagrid"):
+            day = datetime.strptime(form["search_currentdate"], "%d/%m/%Y").strftime("%d-%m-%Y")
+            rows = [data.qc_grid_row(channel_id, day) for channel_id in self.upstreams.channel_ids]
+            return handler._send_json({"qcGridData": rows})
+        day = datetime.strptime(form["search_datenumber"], "%Y%m%d").strftime("%d-%m-%Y")
+        stories = [{"clipendtime": data.qc_end_time(form["search_barcchannelcode"], day)}]
+        handler._send_json({"data": json.dumps(stories)})
+
+
+class StandinUpstreams:
+    """Starts the three stand-in servers and counts the requests each one receives.
+
+    clusters is the app's CLUSTERS mapping; every channel in it appears on the QC grid.
+    """
+    def __init__(self, clusters, **config):
+        self.config = dict(DEFAULT_STANDIN_CONFIG, **config)
+        self.channel_ids = sorted({channel_id for channel_ids in clusters.values() for channel_id in channel_ids})
+        self.data = StandinData(self.config, clusters)
+        self.lock = threading.Lock()
+        self.qc_sessions = {}
+        self.request_counts = {}
+        self._servers = []
+
+    def count(self, server_name, path):
+        with self.lock:
+            key = f"{server_name} {path.rsplit('/', 2)[0] if server_name == 'eq' else path}"
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+    def start(self):
+        for server_class in (XenServer, EQServer, QCServer):
+            server = server_class(("127.0.0.1", 0), StandinHandler)
+            server.upstreams = self
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self._servers.append(server)
+        return self
+
+    def stop(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def base_url(self, name):
+        server = next(server for server in self._servers if server.name == name)
+        host, port = server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def app_urls(self):
+        """The app's upstream URL settings, pointed at the stand-ins"""
+        qc_base = f"{self.base_url('qc')}/tabsons"
+        return {
+            "XEN_API_URL": f"{self.base_url('xen')}/command/ExportEPGTabsons",
+            "EQ_API_URL": f"{self.base_url('eq')}/api/tabsons/getreport/{{channel_id}}/{{date}}",
+            "QC_BASE_URL": qc_base,
+        }